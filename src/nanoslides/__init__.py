@@ -1,11 +1,40 @@
 """Nanoslides: A library and CLI for generating AI-powered presentation slides."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 
-from nanoslides.core.interfaces import SlideEngine, SlideResult
-from nanoslides.core.project import ProjectState, SlideEntry, load_project_state, save_project_state
-from nanoslides.core.style import ResolvedStyle, ProjectStyleConfig, load_project_style
-from nanoslides.engines.nanobanana import NanoBananaSlideEngine, NanoBananaModel, ImageAspectRatio
+if TYPE_CHECKING:
+    from nanoslides.core.interfaces import SlideEngine, SlideResult
+    from nanoslides.core.project import (
+        ProjectState,
+        SlideEntry,
+        load_project_state,
+        save_project_state,
+    )
+    from nanoslides.core.style import ProjectStyleConfig, ResolvedStyle, load_project_style
+    from nanoslides.engines.nanobanana import NanoBananaSlideEngine
+    from nanoslides.engines.nanobanana_models import ImageAspectRatio, NanoBananaModel
+
+# Public names are resolved on first attribute access (PEP 562) so that
+# `import nanoslides` does not pull in pydantic, yaml or the Gemini SDK.
+_LAZY = {
+    "SlideEngine": "nanoslides.core.interfaces",
+    "SlideResult": "nanoslides.core.interfaces",
+    "ProjectState": "nanoslides.core.project",
+    "SlideEntry": "nanoslides.core.project",
+    "load_project_state": "nanoslides.core.project",
+    "save_project_state": "nanoslides.core.project",
+    "ResolvedStyle": "nanoslides.core.style",
+    "ProjectStyleConfig": "nanoslides.core.style",
+    "load_project_style": "nanoslides.core.style",
+    "NanoBananaSlideEngine": "nanoslides.engines.nanobanana",
+    "NanoBananaModel": "nanoslides.engines.nanobanana_models",
+    "ImageAspectRatio": "nanoslides.engines.nanobanana_models",
+}
 
 __all__ = [
     "SlideEngine",
@@ -21,3 +50,16 @@ __all__ = [
     "NanoBananaModel",
     "ImageAspectRatio",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
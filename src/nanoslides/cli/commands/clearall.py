@@ -18,6 +18,7 @@ from nanoslides.core.project import (
 )
 
 console = Console()
+_TABLE_MAX_ROWS = 50
 
 
 def clearall_command() -> None:
@@ -35,7 +36,20 @@ def clearall_command() -> None:
         console.print("[yellow]No slides found in project.[/]")
         return
 
-    console.print(_slides_table(ordered_slides))
+    if console.is_terminal:
+        console.print(_slides_table(ordered_slides))
+        hidden_count = len(ordered_slides) - _TABLE_MAX_ROWS
+        if hidden_count > 0:
+            console.print(f"[dim]({hidden_count} slides not shown)[/]")
+    else:
+        console.out(
+            "\n".join(
+                f"{slide.order}\t{slide.id}\t{'draft' if slide.is_draft else 'main'}\t"
+                f"{slide.image_path or '-'}"
+                for slide in ordered_slides
+            ),
+            highlight=False,
+        )
     should_delete = Confirm.ask(
         f"Delete all {len(ordered_slides)} slides from {PROJECT_STATE_FILE}? "
         "This cannot be undone.",
@@ -48,6 +62,12 @@ def clearall_command() -> None:
     presentation.slides = []
     save_project_state(presentation.to_project_state())
 
+    if not console.is_terminal:
+        console.out(
+            f"Cleared {len(ordered_slides)} slides from {PROJECT_STATE_FILE}",
+            highlight=False,
+        )
+        return
     console.print(
         Panel.fit(
             f"[bold green]Cleared all slides[/]\n"
@@ -59,12 +79,24 @@ def clearall_command() -> None:
     )
 
 
-def _slides_table(slides: list[SlideEntry]) -> Table:
+def _slides_table(slides: list[SlideEntry], max_rows: int = _TABLE_MAX_ROWS) -> Table:
     table = Table(title="Slides to delete", box=box.ROUNDED, header_style="bold")
     table.add_column("Order", justify="right")
     table.add_column("ID")
     table.add_column("Type")
     table.add_column("Path")
+    if len(slides) <= max_rows:
+        _add_slide_rows(table, slides)
+        return table
+
+    head_count = max_rows // 2
+    _add_slide_rows(table, slides[:head_count])
+    table.add_row("...", "...", "...", "...")
+    _add_slide_rows(table, slides[len(slides) - (max_rows - head_count) :])
+    return table
+
+
+def _add_slide_rows(table: Table, slides: list[SlideEntry]) -> None:
     for slide in slides:
         table.add_row(
             str(slide.order),
@@ -72,4 +104,3 @@ def _slides_table(slides: list[SlideEntry]) -> Table:
             "draft" if slide.is_draft else "main",
             slide.image_path or "-",
         )
-    return table
@@ -2,31 +2,41 @@
 
 from __future__ import annotations
 
-import os
 from pathlib import Path
 import sys
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 
+from nanoslides.cli.config_context import resolve_config
 from nanoslides.cli.image_store import persist_slide_result
+from nanoslides.cli.progress import status
 from nanoslides.cli.reference_files import (
     add_reference_file_metadata,
     inject_reference_file_context,
     resolve_reference_files,
 )
-from nanoslides.core.config import GlobalConfig, get_gemini_api_key, load_global_config
-from nanoslides.core.presentation import Presentation
-from nanoslides.core.project import (
-    PROJECT_STATE_FILE,
-    SlideEntry,
-    load_project_state,
-    save_project_state,
+from nanoslides.cli.slide_lookup import (
+    clear_path_caches,
+    find_slide_by_path,
+    resolve_slide_image_path,
 )
-from nanoslides.core.style import merge_style_references, resolve_style_context
-from nanoslides.engines.nanobanana import NanoBananaModel, NanoBananaSlideEngine
+from nanoslides.core.config import get_gemini_api_key
+from nanoslides.core.interfaces import SlideResult
+from nanoslides.core.presentation import Presentation, ProjectStateWriter
+from nanoslides.core.project import PROJECT_STATE_FILE, SlideEntry, load_project_state
+from nanoslides.core.style import (
+    ResolvedStyle,
+    merge_style_references,
+    resolve_style_context,
+)
+from nanoslides.engines.nanobanana_models import NanoBananaModel
+
+if TYPE_CHECKING:
+    from nanoslides.engines.nanobanana import NanoBananaSlideEngine
 
 console = Console()
 
@@ -80,7 +90,8 @@ def edit_command(
     ),
 ) -> None:
     """Edit an existing slide image from an ID or file path."""
-    config = _resolve_config(ctx)
+    clear_path_caches()
+    config = resolve_config(ctx)
     target_output_dir = output_dir or Path(config.default_output_dir)
     api_key = get_gemini_api_key(config)
     effective_model = model or NanoBananaModel.PRO
@@ -96,105 +107,120 @@ def edit_command(
         source_image_path, presentation, slide_entry = _resolve_edit_target(target)
         resolved_style = resolve_style_context(style_id=effective_style_id)
         merged_style = merge_style_references(resolved_style, selected_references)
+        # Imported lazily: the engine pulls in the Gemini SDK, which `--help`
+        # and argument validation never need.
+        from nanoslides.engines.nanobanana import NanoBananaSlideEngine
+
         engine = NanoBananaSlideEngine(
             model=effective_model,
             api_key=api_key,
         )
-        while True:
-            contextual_instruction = inject_reference_file_context(
-                current_instruction,
-                selected_reference_files,
-            )
-            results = []
-            for index in range(variations):
-                status_message = (
-                    f"[bold cyan]Editing slide variation {index + 1}/{variations}...[/]"
-                    if variations > 1
-                    else "[bold cyan]Editing slide...[/]"
+        source_image_bytes = source_image_path.read_bytes()
+        reference_image_bytes = engine.prepare_reference_images(merged_style)
+        with ProjectStateWriter(presentation) as state_writer:
+            while True:
+                contextual_instruction = inject_reference_file_context(
+                    current_instruction,
+                    selected_reference_files,
+                )
+                results = _run_edit_variations(
+                    engine,
+                    source_image_bytes=source_image_bytes,
+                    instruction=contextual_instruction,
+                    style=merged_style,
+                    reference_images=reference_image_bytes,
+                    variations=variations,
+                )
+
+                selected_index = _select_variation_index(count=len(results))
+                selected_result = results[selected_index]
+                selected_metadata = add_reference_file_metadata(
+                    selected_result.metadata,
+                    selected_reference_files,
                 )
-                with console.status(status_message, spinner="dots"):
-                    results.append(
-                        engine.edit(
-                            image=source_image_path.read_bytes(),
-                            instruction=contextual_instruction,
-                            style=merged_style,
+                persisted_path = persist_slide_result(
+                    selected_result,
+                    output_dir=target_output_dir,
+                    file_prefix="slide-edit",
+                )
+                draft_entry = _create_edit_draft(
+                    state_writer=state_writer,
+                    presentation=presentation,
+                    slide_entry=slide_entry,
+                    source_image_path=source_image_path,
+                    instruction=current_instruction,
+                    edited_image_path=persisted_path,
+                    metadata=selected_metadata,
+                )
+
+                style_label = merged_style.style_id or "project/default"
+                references_count = len(merged_style.reference_images)
+                source_label = slide_entry.id if slide_entry else str(source_image_path)
+                if draft_entry is not None and slide_entry is not None and presentation is not None:
+                    if not console.is_terminal:
+                        console.out(
+                            f"Draft slide saved: {source_label} -> {draft_entry.id} "
+                            f"({persisted_path})",
+                            highlight=False,
+                        )
+                    else:
+                        console.print(
+                            Panel.fit(
+                                f"[bold yellow]Draft slide saved[/]\n"
+                                f"Source: [bold]{source_label}[/]\n"
+                                f"Draft ID: [bold]{draft_entry.id}[/]\n"
+                                f"Model: [bold]{effective_model.value}[/]\n"
+                                f"Style: [bold]{style_label}[/]\n"
+                                f"References: [bold]{references_count}[/]\n"
+                                f"Reference files: [bold]{len(selected_reference_files)}[/]\n"
+                                f"Variation: [bold]{selected_index + 1}/{len(results)}[/]\n"
+                                f"Saved to [bold]{persisted_path}[/]\n"
+                                f"Status: [bold]Needs review before applying[/]",
+                                title="nanoslides",
+                                border_style="yellow",
+                            )
                         )
+                    if _should_apply_draft(slide_entry.id, draft_entry.id):
+                        _apply_draft_to_slide(
+                            presentation=presentation,
+                            slide_entry=slide_entry,
+                            draft_entry=draft_entry,
+                        )
+                        state_writer.flush(force=True)
+                        console.print(
+                            f"[bold green]Draft '{draft_entry.id}' applied to slide "
+                            f"'{slide_entry.id}'.[/]"
+                        )
+                        return
+                    if _should_retry_edit_with_new_instruction(slide_entry.id, draft_entry.id):
+                        current_instruction = _prompt_new_edit_instruction(current_instruction)
+                        continue
+                    console.print(
+                        f"[bold yellow]Draft '{draft_entry.id}' kept for later review.[/]"
                     )
+                    return
 
-            selected_index = _select_variation_index(count=len(results))
-            selected_result = results[selected_index]
-            selected_metadata = add_reference_file_metadata(
-                selected_result.metadata,
-                selected_reference_files,
-            )
-            persisted_path = persist_slide_result(
-                selected_result,
-                output_dir=target_output_dir,
-                file_prefix="slide-edit",
-            )
-            draft_entry = _create_edit_draft(
-                presentation=presentation,
-                slide_entry=slide_entry,
-                source_image_path=source_image_path,
-                instruction=current_instruction,
-                edited_image_path=persisted_path,
-                metadata=selected_metadata,
-            )
-
-            style_label = merged_style.style_id or "project/default"
-            references_count = len(merged_style.reference_images)
-            source_label = slide_entry.id if slide_entry else str(source_image_path)
-            if draft_entry is not None and slide_entry is not None and presentation is not None:
+                if not console.is_terminal:
+                    console.out(
+                        f"Slide edited: {source_label} -> {persisted_path}",
+                        highlight=False,
+                    )
+                    return
                 console.print(
                     Panel.fit(
-                        f"[bold yellow]Draft slide saved[/]\n"
+                        f"[bold green]Slide edited[/]\n"
                         f"Source: [bold]{source_label}[/]\n"
-                        f"Draft ID: [bold]{draft_entry.id}[/]\n"
                         f"Model: [bold]{effective_model.value}[/]\n"
                         f"Style: [bold]{style_label}[/]\n"
                         f"References: [bold]{references_count}[/]\n"
                         f"Reference files: [bold]{len(selected_reference_files)}[/]\n"
                         f"Variation: [bold]{selected_index + 1}/{len(results)}[/]\n"
-                        f"Saved to [bold]{persisted_path}[/]\n"
-                        f"Status: [bold]Needs review before applying[/]",
+                        f"Saved to [bold]{persisted_path}[/]",
                         title="nanoslides",
-                        border_style="yellow",
+                        border_style="green",
                     )
                 )
-                if _should_apply_draft(slide_entry.id, draft_entry.id):
-                    _apply_draft_to_slide(
-                        presentation=presentation,
-                        slide_entry=slide_entry,
-                        draft_entry=draft_entry,
-                    )
-                    console.print(
-                        f"[bold green]Draft '{draft_entry.id}' applied to slide "
-                        f"'{slide_entry.id}'.[/]"
-                    )
-                    return
-                if _should_retry_edit_with_new_instruction(slide_entry.id, draft_entry.id):
-                    current_instruction = _prompt_new_edit_instruction(current_instruction)
-                    continue
-                console.print(
-                    f"[bold yellow]Draft '{draft_entry.id}' kept for later review.[/]"
-                )
                 return
-
-            console.print(
-                Panel.fit(
-                    f"[bold green]Slide edited[/]\n"
-                    f"Source: [bold]{source_label}[/]\n"
-                    f"Model: [bold]{effective_model.value}[/]\n"
-                    f"Style: [bold]{style_label}[/]\n"
-                    f"References: [bold]{references_count}[/]\n"
-                    f"Reference files: [bold]{len(selected_reference_files)}[/]\n"
-                    f"Variation: [bold]{selected_index + 1}/{len(results)}[/]\n"
-                    f"Saved to [bold]{persisted_path}[/]",
-                    title="nanoslides",
-                    border_style="green",
-                )
-            )
-            return
     except ValueError as exc:
         console.print(f"[bold red]{exc}[/]")
         raise typer.Exit(code=1) from exc
@@ -203,6 +229,36 @@ def edit_command(
         raise typer.Exit(code=1) from exc
 
 
+def _run_edit_variations(
+    engine: NanoBananaSlideEngine,
+    *,
+    source_image_bytes: bytes,
+    instruction: str,
+    style: ResolvedStyle,
+    reference_images: list[bytes],
+    variations: int,
+) -> list[SlideResult]:
+    # The engine (and its Gemini client) is built once per command and reused
+    # for every variation and every retry with a new instruction.
+    results: list[SlideResult] = []
+    for index in range(variations):
+        status_message = (
+            f"[bold cyan]Editing slide variation {index + 1}/{variations}...[/]"
+            if variations > 1
+            else "[bold cyan]Editing slide...[/]"
+        )
+        with status(console, status_message):
+            results.append(
+                engine.edit(
+                    image=source_image_bytes,
+                    instruction=instruction,
+                    style=style,
+                    reference_images=reference_images,
+                )
+            )
+    return results
+
+
 def _resolve_edit_target(target: str) -> tuple[Path, Presentation | None, SlideEntry | None]:
     target_path = Path(target).expanduser()
     presentation = (
@@ -210,15 +266,16 @@ def _resolve_edit_target(target: str) -> tuple[Path, Presentation | None, SlideE
         if PROJECT_STATE_FILE.exists()
         else None
     )
+    slides = presentation.slides if presentation is not None else []
 
     if target_path.exists():
         if not target_path.is_file():
             raise ValueError(f"Edit target is not a file: {target_path}")
         resolved_target = target_path.resolve()
-        matched_slide = _find_slide_by_path(presentation, resolved_target)
+        matched_slide = find_slide_by_path(slides, resolved_target)
         return resolved_target, presentation, matched_slide
 
-    matched_slide = _find_slide_by_id(presentation, target)
+    matched_slide = next((slide for slide in slides if slide.id == target), None)
     if matched_slide is None:
         raise ValueError(
             f"Slide target '{target}' was not found. Use a slide ID from {PROJECT_STATE_FILE} "
@@ -227,52 +284,15 @@ def _resolve_edit_target(target: str) -> tuple[Path, Presentation | None, SlideE
     if not matched_slide.image_path:
         raise ValueError(f"Slide '{target}' has no image path in {PROJECT_STATE_FILE}.")
 
-    resolved_target = _resolve_slide_image_path(matched_slide.image_path)
-    if not resolved_target.exists() or not resolved_target.is_file():
+    resolved_target = resolve_slide_image_path(matched_slide.image_path)
+    if not resolved_target.is_file():
         raise ValueError(f"Slide image not found: {resolved_target}")
     return resolved_target, presentation, matched_slide
 
 
-def _find_slide_by_id(
-    presentation: Presentation | None,
-    target_id: str,
-) -> SlideEntry | None:
-    if presentation is None:
-        return None
-    for slide in presentation.slides:
-        if slide.id == target_id:
-            return slide
-    return None
-
-
-def _find_slide_by_path(
-    presentation: Presentation | None,
-    image_path: Path,
-) -> SlideEntry | None:
-    if presentation is None:
-        return None
-    normalized_target = _normalize_path(image_path)
-    for slide in presentation.slides:
-        if not slide.image_path:
-            continue
-        if _normalize_path(_resolve_slide_image_path(slide.image_path)) == normalized_target:
-            return slide
-    return None
-
-
-def _resolve_slide_image_path(raw_path: str) -> Path:
-    image_path = Path(raw_path).expanduser()
-    if not image_path.is_absolute():
-        image_path = Path.cwd() / image_path
-    return image_path.resolve()
-
-
-def _normalize_path(path: Path) -> str:
-    return os.path.normcase(str(path.resolve()))
-
-
 def _create_edit_draft(
     *,
+    state_writer: ProjectStateWriter,
     presentation: Presentation | None,
     slide_entry: SlideEntry | None,
     source_image_path: Path,
@@ -293,7 +313,7 @@ def _create_edit_draft(
             "edited_from": str(source_image_path),
         },
     )
-    save_project_state(presentation.to_project_state())
+    state_writer.mark_dirty()
     return draft_entry
 
 
@@ -309,7 +329,6 @@ def _apply_draft_to_slide(
     slide_entry.metadata = source_slide.metadata
     slide_entry.is_draft = source_slide.is_draft
     slide_entry.draft_of = source_slide.draft_of
-    save_project_state(presentation.to_project_state())
 
 
 def _should_apply_draft(source_slide_id: str, draft_id: str) -> bool:
@@ -360,9 +379,3 @@ def _select_variation_index(*, count: int) -> int:
     )
     return int(selected) - 1
 
-
-def _resolve_config(ctx: typer.Context) -> GlobalConfig:
-    if ctx.obj and isinstance(ctx.obj.get("config"), GlobalConfig):
-        return ctx.obj["config"]
-    return load_global_config()
-
@@ -2,42 +2,59 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
+from tenacity import (
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
 
+from nanoslides.cli.config_context import resolve_config
 from nanoslides.cli.image_store import persist_slide_result
+from nanoslides.cli.progress import status
 from nanoslides.cli.reference_files import (
     add_reference_file_metadata,
     inject_reference_file_context,
     resolve_reference_files,
 )
-from nanoslides.core.config import GlobalConfig, get_gemini_api_key, load_global_config
+from nanoslides.core.config import get_gemini_api_key
 from nanoslides.core.interfaces import SlideResult
-from nanoslides.core.presentation import Presentation
-from nanoslides.core.project import (
-    PROJECT_STATE_FILE,
-    load_project_state,
-    save_project_state,
-)
+from nanoslides.core.presentation import Presentation, ProjectStateWriter
+from nanoslides.core.project import load_project_state, save_project_state
+from nanoslides.core.provider_errors import is_retryable_error
 from nanoslides.core.style import (
+    GLOBAL_STYLES_PATH,
+    ResolvedStyle,
     load_global_styles,
     merge_style_references,
     load_project_style,
     resolve_style_context,
 )
-from nanoslides.engines.nanobanana import (
-    ImageAspectRatio,
-    NanoBananaModel,
-    NanoBananaSlideEngine,
-)
+from nanoslides.engines.nanobanana_models import ImageAspectRatio, NanoBananaModel
+from nanoslides.utils.concurrency import run_concurrently
+from nanoslides.utils.io import find_missing_files
+
+if TYPE_CHECKING:
+    from nanoslides.engines.nanobanana import NanoBananaSlideEngine
 
 console = Console()
+# Default filesystems on macOS and Windows treat `Image.PNG` and `image.png` alike.
+_FS_CASE_INSENSITIVE = sys.platform in ("darwin", "win32")
+_MODEL_CHOICES: tuple[str, ...] = tuple(selector.value for selector in NanoBananaModel)
+_RETRY_ATTEMPTS = 5
+_RETRY_WAIT = wait_exponential(multiplier=1, min=2, max=60)
 
 
 def generate_command(
@@ -91,6 +108,20 @@ def generate_command(
         min=1,
         help="Number of variations to generate before choosing one to save.",
     ),
+    concurrency: int = typer.Option(
+        5,
+        "--concurrency",
+        min=1,
+        help="Maximum number of variations requested in parallel.",
+    ),
+    use_batch: bool = typer.Option(
+        False,
+        "--use-batch",
+        help=(
+            "Submit variations as one Gemini batch job (cheaper, but can take "
+            "minutes to hours)."
+        ),
+    ),
     no_interactive: bool = typer.Option(
         False,
         "--no-interactive",
@@ -124,7 +155,7 @@ def generate_command(
         console.print("[bold red]Prompt is required.[/]")
         raise typer.Exit(code=1)
 
-    config = _resolve_config(ctx)
+    config = resolve_config(ctx)
     target_output_dir = output_dir or Path(config.default_output_dir)
     api_key = get_gemini_api_key(config)
     effective_model = selected_model or NanoBananaModel.PRO
@@ -136,24 +167,40 @@ def generate_command(
         )
         resolved_style = resolve_style_context(style_id=effective_style_id)
         merged_style = merge_style_references(resolved_style, selected_references)
-        engine = NanoBananaSlideEngine(
-            model=effective_model,
-            api_key=api_key,
-        )
-        results = []
-        for index in range(variations):
+        engine = _get_engine(effective_model, api_key)
+        reference_images = engine.prepare_reference_images(merged_style)
+        if use_batch and variations > 1:
+            with status(
+                console,
+                f"[bold cyan]Waiting for batch job with {variations} variations...[/]",
+                animate=not no_interactive,
+            ):
+                results = engine.generate_batch(
+                    [contextual_prompt] * variations,
+                    style=merged_style,
+                    aspect_ratio=aspect_ratio,
+                    reference_images=reference_images,
+                )
+        else:
             status_message = (
-                f"[bold cyan]Generating slide variation {index + 1}/{variations}...[/]"
+                f"[bold cyan]Generating {variations} slide variations concurrently...[/]"
                 if variations > 1
                 else "[bold cyan]Generating slide...[/]"
             )
-            with console.status(status_message, spinner="dots"):
-                results.append(
-                    engine.generate(
-                        prompt=contextual_prompt,
-                        style=merged_style,
-                        aspect_ratio=aspect_ratio,
-                    )
+            with status(console, status_message, animate=not no_interactive):
+                results = run_concurrently(
+                    [
+                        functools.partial(
+                            _generate_with_retry,
+                            engine,
+                            prompt=contextual_prompt,
+                            style=merged_style,
+                            aspect_ratio=aspect_ratio,
+                            reference_images=reference_images,
+                        )
+                    ]
+                    * variations,
+                    concurrency=concurrency,
                 )
     except ValueError as exc:
         console.print(f"[bold red]{exc}[/]")
@@ -175,6 +222,7 @@ def generate_command(
     selected_metadata = add_reference_file_metadata(
         selected_result.metadata,
         selected_reference_files,
+        inplace=True,
     )
     persisted_path = persist_slide_result(selected_result, output_dir=target_output_dir)
     final_local_path, slide_id = _append_slide_to_project(
@@ -201,6 +249,38 @@ def generate_command(
     )
 
 
+def _generate_with_retry(
+    engine: NanoBananaSlideEngine,
+    *,
+    prompt: str,
+    style: ResolvedStyle,
+    aspect_ratio: ImageAspectRatio,
+    reference_images: list[bytes] | None = None,
+) -> SlideResult:
+    retrying = Retrying(
+        retry=retry_if_exception(is_retryable_error),
+        wait=_RETRY_WAIT,
+        stop=stop_after_attempt(_RETRY_ATTEMPTS),
+        before_sleep=_log_retry,
+        reraise=True,
+    )
+    return retrying(
+        engine.generate,
+        prompt=prompt,
+        style=style,
+        aspect_ratio=aspect_ratio,
+        reference_images=reference_images,
+    )
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    delay = retry_state.next_action.sleep if retry_state.next_action else 0
+    console.print(
+        f"[yellow]Transient provider error (attempt {retry_state.attempt_number}/"
+        f"{_RETRY_ATTEMPTS}); retrying in {delay:.0f}s...[/]"
+    )
+
+
 def _collect_interactive_inputs(
     *,
     prompt: str | None,
@@ -226,7 +306,7 @@ def _prompt_model(model: NanoBananaModel | None) -> NanoBananaModel:
     default_model = (model or NanoBananaModel.PRO).value
     selected_model = Prompt.ask(
         "2) Model",
-        choices=[selector.value for selector in NanoBananaModel],
+        choices=list(_MODEL_CHOICES),
         default=default_model,
     )
     return NanoBananaModel(selected_model)
@@ -234,7 +314,6 @@ def _prompt_model(model: NanoBananaModel | None) -> NanoBananaModel:
 
 def _prompt_style_id(style_id: str | None) -> str:
     project_style = load_project_style()
-    global_styles = sorted(load_global_styles().styles.keys())
     default_style_id = (
         style_id
         or (project_style.style_id if project_style and project_style.style_id else None)
@@ -244,9 +323,8 @@ def _prompt_style_id(style_id: str | None) -> str:
     table = Table(title="3) Available style presets", show_header=True, header_style="bold")
     table.add_column("Preset")
     table.add_column("Scope")
-    table.add_row("default", "No global preset")
-    for preset in global_styles:
-        table.add_row(preset, "global")
+    for row in _styles_rows(_global_styles_signature()):
+        table.add_row(*row)
     console.print(table)
 
     selected_style_id = Prompt.ask(
@@ -258,6 +336,31 @@ def _prompt_style_id(style_id: str | None) -> str:
     return selected_style_id
 
 
+@functools.lru_cache(maxsize=4)
+def _get_engine(model: NanoBananaModel, api_key: str | None) -> NanoBananaSlideEngine:
+    """Return an engine for `model`, reusing its Gemini client across calls."""
+    # Imported lazily: the engine pulls in the Gemini SDK, which `--help`
+    # and argument validation never need.
+    from nanoslides.engines.nanobanana import NanoBananaSlideEngine
+
+    return NanoBananaSlideEngine(model=model, api_key=api_key)
+
+
+def _global_styles_signature() -> tuple[int, int]:
+    try:
+        stat_result = GLOBAL_STYLES_PATH.stat()
+    except FileNotFoundError:
+        return (0, 0)
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+@functools.lru_cache(maxsize=1)
+def _styles_rows(signature: tuple[int, int]) -> tuple[tuple[str, str], ...]:
+    # `signature` only keys the cache so edits to styles.json invalidate it.
+    presets = sorted(load_global_styles().styles)
+    return (("default", "No global preset"), *((preset, "global") for preset in presets))
+
+
 def _prompt_references() -> list[Path]:
     raw_paths = Prompt.ask(
         "4) Reference image paths (optional, comma-separated)",
@@ -266,21 +369,13 @@ def _prompt_references() -> list[Path]:
     if not raw_paths:
         return []
 
-    references: list[Path] = []
-    for raw_path in raw_paths.split(","):
-        path = Path(raw_path.strip()).expanduser()
-        if not path.exists() or not path.is_file():
-            raise ValueError(f"Reference image not found: {path}")
-        references.append(path)
+    references = [Path(raw_path.strip()).expanduser() for raw_path in raw_paths.split(",")]
+    missing = find_missing_files([str(path) for path in references])
+    if missing:
+        raise ValueError(f"Reference image not found: {missing[0]}")
     return references
 
 
-def _resolve_config(ctx: typer.Context) -> GlobalConfig:
-    if ctx.obj and isinstance(ctx.obj.get("config"), GlobalConfig):
-        return ctx.obj["config"]
-    return load_global_config()
-
-
 def _select_variation_index(*, count: int, no_interactive: bool) -> int:
     if count <= 1:
         return 0
@@ -337,11 +432,23 @@ def _append_slide_to_project(
     prompt: str,
     local_path: Path | None,
     metadata: dict[str, object],
+    *,
+    state_writer: ProjectStateWriter | None = None,
 ) -> tuple[Path | None, str | None]:
-    if not PROJECT_STATE_FILE.exists():
-        return local_path, None
+    """Track a generated slide in the project state.
+
+    When `state_writer` is given (see `Presentation.batch()`), the slide is added
+    to its presentation and the save is deferred to the writer's flush.
+    """
+    if state_writer is not None and state_writer.presentation is not None:
+        presentation = state_writer.presentation
+    else:
+        try:
+            state = load_project_state()
+        except FileNotFoundError:
+            return local_path, None
+        presentation = Presentation.from_project_state(state)
 
-    presentation = Presentation.from_project_state(load_project_state())
     slide_entry = presentation.add_slide(
         prompt=prompt,
         image_path=None,
@@ -349,7 +456,10 @@ def _append_slide_to_project(
     )
     renamed_path = _rename_slide_file(local_path, slide_entry.order, slide_entry.id)
     slide_entry.image_path = str(renamed_path) if renamed_path else None
-    save_project_state(presentation.to_project_state())
+    if state_writer is not None:
+        state_writer.mark_dirty()
+    else:
+        save_project_state(presentation.to_project_state())
     return renamed_path, slide_entry.id
 
 
@@ -358,13 +468,15 @@ def _resolve_cli_references(
     extra_args: list[str],
 ) -> list[Path]:
     resolved = list(references or [])
+    normalized_args: list[str] = []
     for extra_arg in extra_args:
-        if extra_arg.startswith("-"):
+        if extra_arg[:1] == "-":
             raise ValueError(f"Unexpected option: {extra_arg}")
-        path = Path(extra_arg).expanduser()
-        if not path.exists() or not path.is_file():
-            raise ValueError(f"Reference image not found: {path}")
-        resolved.append(path)
+        normalized_args.append(_normalize_reference_path(extra_arg))
+    missing = find_missing_files(normalized_args)
+    if missing:
+        raise ValueError(f"Reference image not found: {missing[0]}")
+    resolved.extend(Path(normalized) for normalized in normalized_args)
     return _unique_paths(resolved)
 
 
@@ -372,14 +484,20 @@ def _unique_paths(paths: list[Path]) -> list[Path]:
     seen: set[str] = set()
     unique: list[Path] = []
     for path in paths:
-        normalized = str(path.expanduser().resolve())
-        if normalized in seen:
+        normalized = _normalize_reference_path(path)
+        key = normalized.lower() if _FS_CASE_INSENSITIVE else normalized
+        if key in seen:
             continue
-        seen.add(normalized)
+        seen.add(key)
         unique.append(Path(normalized))
     return unique
 
 
+def _normalize_reference_path(path: str | Path) -> str:
+    # Lexical normalization only: no realpath/readlink syscalls per reference.
+    return os.path.normpath(os.path.abspath(os.path.expanduser(path)))
+
+
 def _rename_slide_file(local_path: Path | None, order: int, slide_id: str) -> Path | None:
     if local_path is None or not local_path.exists():
         return local_path
@@ -390,13 +508,12 @@ def _rename_slide_file(local_path: Path | None, order: int, slide_id: str) -> Pa
         return local_path
 
     if target.exists():
+        # One directory listing instead of a stat() per taken counter value.
+        existing_names = set(os.listdir(local_path.parent))
         counter = 2
-        while True:
-            candidate = local_path.with_name(f"{order}_{slide_id}-{counter}{suffix}")
-            if not candidate.exists():
-                target = candidate
-                break
+        while f"{order}_{slide_id}-{counter}{suffix}" in existing_names:
             counter += 1
+        target = local_path.with_name(f"{order}_{slide_id}-{counter}{suffix}")
 
     local_path.rename(target)
     return target
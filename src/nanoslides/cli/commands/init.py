@@ -8,7 +8,7 @@ from pathlib import Path
 import typer
 from rich.console import Console
 
-from nanoslides.core.config import GlobalConfig, load_global_config
+from nanoslides.cli.config_context import resolve_config
 from nanoslides.core.presentation import Presentation
 from nanoslides.core.project import PROJECT_STATE_FILE, save_project_state
 
@@ -37,7 +37,7 @@ def init_command(
         )
         raise typer.Exit(code=1)
 
-    config = _resolve_config(ctx)
+    config = resolve_config(ctx)
     presentation = Presentation(
         name=project_name,
         created_at=datetime.now(timezone.utc),
@@ -51,9 +51,3 @@ def init_command(
         f"{project_state_path.resolve()}[/]"
     )
 
-
-def _resolve_config(ctx: typer.Context) -> GlobalConfig:
-    if ctx.obj and isinstance(ctx.obj.get("config"), GlobalConfig):
-        return ctx.obj["config"]
-    return load_global_config()
-
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import typer
 from rich import box
-from rich.console import Console
+from rich.console import Console, RenderableType
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
 from nanoslides.core.presentation import Presentation
 from nanoslides.core.project import PROJECT_STATE_FILE, SlideEntry, load_project_state, save_project_state
@@ -41,21 +42,17 @@ def move_command(
         )
         raise typer.Exit(code=1)
 
-    current_index = next(
-        (index for index, slide in enumerate(ordered_slides) if slide.id == slide_id),
-        None,
-    )
-    if current_index is None:
+    try:
+        current_pos, _ = presentation.move_slide(slide_id, new_pos)
+    except ValueError as exc:
         console.print(f"[bold red]Slide '{slide_id}' was not found in {PROJECT_STATE_FILE}.[/]")
-        raise typer.Exit(code=1)
+        raise typer.Exit(code=1) from exc
 
-    current_pos = current_index + 1
     if current_pos == new_pos:
         console.print(f"[yellow]Slide '{slide_id}' is already at position {new_pos}.[/]")
         console.print(_slides_table(ordered_slides))
         return
 
-    presentation.move_slide(slide_id, new_pos)
     save_project_state(presentation.to_project_state())
 
     console.print(
@@ -71,11 +68,15 @@ def move_command(
     console.print(_slides_table(presentation.ordered_main_slides))
 
 
-def _slides_table(slides: list[SlideEntry]) -> Table:
+def _slides_table(slides: list[SlideEntry]) -> RenderableType:
+    rows = [(str(slide.order), slide.id, slide.image_path or "-") for slide in slides]
+    if not console.is_terminal:
+        return Text("\n".join("\t".join(row) for row in rows))
+
     table = Table(title="Updated slide order", box=box.ROUNDED, header_style="bold")
     table.add_column("Order", justify="right")
     table.add_column("ID")
     table.add_column("Path")
-    for slide in slides:
-        table.add_row(str(slide.order), slide.id, slide.image_path or "-")
+    for row in rows:
+        table.add_row(*row)
     return table
@@ -2,31 +2,36 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
+import functools
 import json
 import mimetypes
+import os
 from pathlib import Path
+import re
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from google import genai
-from google.genai import types
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
 
+from nanoslides.cli.config_context import resolve_config
 from nanoslides.cli.image_store import persist_slide_result
+from nanoslides.cli.progress import status, step_progress
 from nanoslides.cli.reference_files import (
     add_reference_file_metadata,
     inject_reference_file_context,
     resolve_reference_files,
 )
-from nanoslides.core.config import GlobalConfig, get_gemini_api_key, load_global_config
+from nanoslides.core.config import get_gemini_api_key
+from nanoslides.core.interfaces import SlideResult
 from nanoslides.core.presentation import Presentation
-from nanoslides.core.provider_errors import is_service_unavailable_error
+from nanoslides.core.provider_errors import extract_status_code, is_service_unavailable_error
 from nanoslides.core.project import (
     PROJECT_STATE_FILE,
     load_project_state,
@@ -37,17 +42,26 @@ from nanoslides.core.style import (
     merge_style_references,
     resolve_style_context,
 )
-from nanoslides.engines.nanobanana import (
-    ImageAspectRatio,
-    NanoBananaModel,
-    NanoBananaSlideEngine,
-)
+from nanoslides.engines.nanobanana_models import ImageAspectRatio, NanoBananaModel
+from nanoslides.utils.concurrency import run_concurrently
+from nanoslides.utils.images import sniff_image_mime_type
+from nanoslides.utils.io import read_files_concurrently
+from nanoslides.utils.jsonio import loads
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from google.genai import types
+
+    from nanoslides.engines.nanobanana import NanoBananaSlideEngine
+
 console = Console()
 _PLANNER_PRIMARY_MODEL = "gemini-3-pro-preview"
 _PLANNER_FALLBACK_MODEL = "gemini-2.5-pro"
 _PLANNER_TIMEOUT_MS = 120_000.0
+_JSON_FENCE_PATTERN = re.compile(r"^```(?:json)?\s*|\s*```$")
+_SECTION_SEPARATOR_PATTERN = re.compile(r"^\s*---+\s*$", re.MULTILINE)
+_SLIDE_MARKER_PATTERN = re.compile(r"^\s*(?:\d+[.)]|[-*])\s+(?P<text>\S.*)$")
+_MAX_PLANNED_SLIDES = 40
 
 
 class DeckDetailMode(str, Enum):
@@ -60,6 +74,20 @@ class DeckLength(str, Enum):
     DEFAULT = "default"
 
 
+_DETAIL_MODE_GUIDANCE = {
+    DeckDetailMode.DETAILED.value: (
+        "A comprehensive deck with full text and details, suitable for emailing or reading alone."
+    ),
+    DeckDetailMode.PRESENTER.value: (
+        "Clean, visual slides with key talking points to support a live presenter."
+    ),
+}
+_LENGTH_GUIDANCE = {
+    DeckLength.SHORT.value: "Keep the deck concise with about 4-6 slides.",
+    DeckLength.DEFAULT.value: "Use however many slides are needed for good coverage.",
+}
+
+
 class PlannedSlide(BaseModel):
     """One slide planned by Gemini 3 Pro."""
 
@@ -74,7 +102,15 @@ class PresentationPlan(BaseModel):
     planning_summary: str = ""
     inferred_style_base_prompt: str = ""
     inferred_style_negative_prompt: str = ""
-    slides: list[PlannedSlide] = Field(default_factory=list, min_length=1, max_length=40)
+    slides: list[PlannedSlide] = Field(
+        default_factory=list, min_length=1, max_length=_MAX_PLANNED_SLIDES
+    )
+
+
+@functools.cache
+def _presentation_plan_schema() -> dict[str, Any]:
+    # Built on first use rather than at import so `nanoslides --help` skips it.
+    return PresentationPlan.model_json_schema()
 
 
 @dataclass(frozen=True)
@@ -157,6 +193,28 @@ def presentation_command(
         "--no-interactive",
         help="Disable guided prompts and use only provided arguments/options.",
     ),
+    concurrency: int = typer.Option(
+        10,
+        "--concurrency",
+        min=1,
+        help="Maximum number of slides generated in parallel.",
+    ),
+    use_batch: bool = typer.Option(
+        False,
+        "--use-batch",
+        help=(
+            "Submit all planned slides as one Gemini batch job (cheaper, but can take "
+            "minutes to hours)."
+        ),
+    ),
+    no_planner: bool = typer.Option(
+        False,
+        "--no-planner",
+        help=(
+            "Skip the Gemini planner and use the slides listed in the description "
+            "(numbered lines, bullets, or sections separated by ---)."
+        ),
+    ),
 ) -> None:
     """Generate an entire deck from one high-level prompt."""
     try:
@@ -178,7 +236,7 @@ def presentation_command(
         console.print(f"[bold red]{exc}[/]")
         raise typer.Exit(code=1) from exc
 
-    config = _resolve_config(ctx)
+    config = resolve_config(ctx)
     api_key = get_gemini_api_key(config)
     if not api_key:
         console.print("[bold red]Missing Gemini API key. Run `nanoslides setup` first.[/]")
@@ -191,14 +249,18 @@ def presentation_command(
     merged_style = merge_style_references(resolved_style, request.references)
 
     try:
-        with console.status("[bold cyan]Planning deck with Gemini 3 Pro...[/]"):
-            plan, planner_model = _plan_presentation(
-                api_key=api_key,
-                request=request,
-                style=merged_style,
-                has_existing_style=has_existing_style,
-            )
-    except RuntimeError as exc:
+        if no_planner:
+            plan = _plan_presentation_locally(request)
+            planner_model = "local"
+        else:
+            with status(console, "[bold cyan]Planning deck with Gemini 3 Pro...[/]"):
+                plan, planner_model = _plan_presentation(
+                    api_key=api_key,
+                    request=request,
+                    style=merged_style,
+                    has_existing_style=has_existing_style,
+                )
+    except (ValueError, RuntimeError) as exc:
         console.print(f"[bold red]Deck planning failed: {exc}[/]")
         raise typer.Exit(code=1) from exc
 
@@ -218,6 +280,8 @@ def presentation_command(
             aspect_ratio=aspect_ratio,
             output_dir=target_output_dir,
             reference_files=request.reference_files,
+            concurrency=concurrency,
+            use_batch=use_batch,
         )
     except (ValueError, RuntimeError) as exc:
         console.print(f"[bold red]Deck generation failed: {exc}[/]")
@@ -237,17 +301,19 @@ def presentation_command(
             str(row["path"]),
             str(row["generate_command"]),
         )
-    console.print(summary)
     console.print(
-        Panel.fit(
-            f"[bold green]Deck generated[/]\n"
-            f"Slides: [bold]{len(generated_rows)}[/]\n"
-            f"Planner: [bold]{planner_model}[/]\n"
-            f"Generator model: [bold]{effective_model.value}[/]\n"
-            f"Reference files: [bold]{len(request.reference_files)}[/]\n"
-            f"Output dir: [bold]{target_output_dir.resolve()}[/]",
-            title="nanoslides",
-            border_style="green",
+        Group(
+            summary,
+            Panel.fit(
+                f"[bold green]Deck generated[/]\n"
+                f"Slides: [bold]{len(generated_rows)}[/]\n"
+                f"Planner: [bold]{planner_model}[/]\n"
+                f"Generator model: [bold]{effective_model.value}[/]\n"
+                f"Reference files: [bold]{len(request.reference_files)}[/]\n"
+                f"Output dir: [bold]{target_output_dir.resolve()}[/]",
+                title="nanoslides",
+                border_style="green",
+            ),
         )
     )
 
@@ -280,7 +346,7 @@ def _collect_interactive_inputs(request: PresentationRequest) -> PresentationReq
         length=length,
         style_id=request.style_id,
         references=request.references,
-        reference_files=resolve_reference_files(request.reference_files),
+        reference_files=request.reference_files,
     )
 
 
@@ -291,13 +357,19 @@ def _plan_presentation(
     style: ResolvedStyle,
     has_existing_style: bool,
 ) -> tuple[PresentationPlan, str]:
-    client = genai.Client(
-        api_key=api_key,
-        http_options=types.HttpOptions(
-            api_version="v1alpha",
-            timeout=_PLANNER_TIMEOUT_MS,
-            retry_options=types.HttpRetryOptions(attempts=2),
-        ),
+    # Imported lazily: the Gemini SDK is only needed once a deck is requested,
+    # not when the CLI registers this command or renders `--help`.
+    from google.genai import types
+
+    from nanoslides.engines.nanobanana import shared_gemini_client
+
+    # The planner shares the slide engine's client and connection pool; its
+    # API version, timeout and retries are applied per request instead.
+    client = shared_gemini_client(api_key)
+    http_options = types.HttpOptions(
+        api_version="v1alpha",
+        timeout=_PLANNER_TIMEOUT_MS,
+        retry_options=types.HttpRetryOptions(attempts=2),
     )
     prompt = _build_planner_prompt(
         request=request,
@@ -319,8 +391,9 @@ def _plan_presentation(
                 config=types.GenerateContentConfig(
                     temperature=1.0,
                     response_mime_type="application/json",
-                    response_json_schema=PresentationPlan.model_json_schema(),
+                    response_json_schema=_presentation_plan_schema(),
                     thinking_config=types.ThinkingConfig(thinking_level="high"),
+                    http_options=http_options,
                 ),
             )
             planner_model_used = planner_model
@@ -341,24 +414,49 @@ def _plan_presentation(
     return plan, planner_model_used
 
 
+def _plan_presentation_locally(request: PresentationRequest) -> PresentationPlan:
+    sections = [
+        section.strip() for section in _SECTION_SEPARATOR_PATTERN.split(request.prompt)
+    ]
+    sections = [section for section in sections if section]
+    if len(sections) > 1:
+        deck_title = _truncate(sections[0].splitlines()[0], length=80)
+        slide_texts = sections
+    else:
+        header: list[str] = []
+        slide_texts = []
+        for line in request.prompt.splitlines():
+            match = _SLIDE_MARKER_PATTERN.match(line)
+            if match:
+                slide_texts.append(match.group("text").strip())
+            elif not slide_texts and line.strip():
+                header.append(line.strip())
+        deck_title = _truncate(" ".join(header), length=80) if header else "Untitled deck"
+    if not slide_texts:
+        raise ValueError(
+            "--no-planner needs explicit slides in the description: numbered lines, "
+            "bullets, or sections separated by ---."
+        )
+    if len(slide_texts) > _MAX_PLANNED_SLIDES:
+        raise ValueError(f"Decks are limited to {_MAX_PLANNED_SLIDES} slides.")
+    return PresentationPlan(
+        deck_title=deck_title,
+        planning_summary="Slides taken from the deck description.",
+        slides=[
+            PlannedSlide(title=_truncate(text.splitlines()[0], length=60), prompt=text)
+            for text in slide_texts
+        ],
+    )
+
+
 def _build_planner_prompt(
     *,
     request: PresentationRequest,
     style: ResolvedStyle,
     has_existing_style: bool,
 ) -> str:
-    detail_mode_guidance = {
-        DeckDetailMode.DETAILED.value: (
-            "A comprehensive deck with full text and details, suitable for emailing or reading alone."
-        ),
-        DeckDetailMode.PRESENTER.value: (
-            "Clean, visual slides with key talking points to support a live presenter."
-        ),
-    }[request.detail_mode]
-    length_guidance = {
-        DeckLength.SHORT.value: "Keep the deck concise with about 4-6 slides.",
-        DeckLength.DEFAULT.value: "Use however many slides are needed for good coverage.",
-    }[request.length]
+    detail_mode_guidance = _DETAIL_MODE_GUIDANCE[request.detail_mode]
+    length_guidance = _LENGTH_GUIDANCE[request.length]
     style_context = "none"
     if has_existing_style:
         style_context = (
@@ -393,14 +491,19 @@ def _build_planner_prompt(
 
 
 def _planner_reference_parts(reference_paths: list[str]) -> list[types.Part]:
-    parts: list[types.Part] = []
+    paths: list[Path] = []
     for raw_path in reference_paths:
         path = Path(raw_path).expanduser().resolve()
-        if not path.exists() or not path.is_file():
+        if not path.is_file():
             raise RuntimeError(f"Style reference image not found: {path}")
-        mime_type, _ = mimetypes.guess_type(str(path))
+        paths.append(path)
+    from google.genai import types
+
+    parts: list[types.Part] = []
+    for path, data in zip(paths, read_files_concurrently(paths)):
+        mime_type = sniff_image_mime_type(data) or mimetypes.guess_type(str(path))[0]
         resolved_mime_type = mime_type or "image/png"
-        parts.append(types.Part.from_bytes(data=path.read_bytes(), mime_type=resolved_mime_type))
+        parts.append(types.Part.from_bytes(data=data, mime_type=resolved_mime_type))
     return parts
 
 
@@ -410,31 +513,31 @@ def _parse_json_response(response: Any) -> dict[str, Any]:
         raw_text = "\n".join(_response_text_parts(response))
     if not raw_text:
         raise RuntimeError("Gemini planner returned no text output.")
-    cleaned = raw_text.strip()
-    if cleaned.startswith("```"):
-        cleaned = cleaned.strip("`")
-        if cleaned.startswith("json"):
-            cleaned = cleaned[len("json") :].strip()
     try:
-        payload = json.loads(cleaned)
-    except json.JSONDecodeError as exc:
-        raise RuntimeError(f"Gemini planner returned invalid JSON: {exc}") from exc
+        # The planner requests application/json, so the text is usually bare JSON.
+        payload = loads(raw_text)
+    except json.JSONDecodeError:
+        cleaned = _JSON_FENCE_PATTERN.sub("", raw_text.strip())
+        try:
+            payload = loads(cleaned)
+        except json.JSONDecodeError as exc:
+            raise RuntimeError(f"Gemini planner returned invalid JSON: {exc}") from exc
     if not isinstance(payload, dict):
         raise RuntimeError("Gemini planner JSON payload must be an object.")
     return payload
 
 
 def _response_text_parts(response: Any) -> list[str]:
-    text_parts: list[str] = []
-    candidates = getattr(response, "candidates", None) or []
-    for candidate in candidates:
-        content = getattr(candidate, "content", None)
-        parts = getattr(content, "parts", None) or []
-        for part in parts:
-            text = getattr(part, "text", None)
-            if text:
-                text_parts.append(str(text))
-    return text_parts
+    try:
+        return [
+            part.text
+            for candidate in response.candidates or []
+            if candidate.content is not None
+            for part in candidate.content.parts or []
+            if part.text
+        ]
+    except AttributeError:
+        return []
 
 
 def _has_resolved_style_context(style: ResolvedStyle) -> bool:
@@ -509,27 +612,93 @@ def _generate_planned_slides(
     aspect_ratio: ImageAspectRatio,
     output_dir: Path,
     reference_files: list[Path],
+    concurrency: int = 10,
+    use_batch: bool = False,
 ) -> list[dict[str, object]]:
+    from nanoslides.engines.nanobanana import NanoBananaSlideEngine
+
     engine = NanoBananaSlideEngine(model=model, api_key=api_key)
     presentation: Presentation | None = None
     if PROJECT_STATE_FILE.exists():
         presentation = Presentation.from_project_state(load_project_state())
 
-    generated_rows: list[dict[str, object]] = []
-    for index, slide in enumerate(plan.slides, start=1):
-        with console.status(
-            f"[bold cyan]Generating slide {index}/{len(plan.slides)}: {slide.title}[/]"
-        ):
-            result = engine.generate(
-                prompt=slide.prompt,
-                style=style,
-                aspect_ratio=aspect_ratio,
+    reference_images = engine.prepare_reference_images(style)
+    persisted: list[tuple[SlideResult, Path] | None] = [None] * len(plan.slides)
+    if use_batch:
+        try:
+            with status(
+                console,
+                f"[bold cyan]Waiting for batch job with {len(plan.slides)} slides...[/]",
+            ):
+                batch_results = engine.generate_batch(
+                    [slide.prompt for slide in plan.slides],
+                    style=style,
+                    aspect_ratio=aspect_ratio,
+                    reference_images=reference_images,
+                )
+        except Exception as exc:
+            status_code = extract_status_code(exc)
+            if status_code is None or not 400 <= status_code < 500:
+                raise
+            console.print(
+                f"[yellow]Batch job was rejected ({status_code}); "
+                "generating slides individually.[/]"
             )
-        persisted_path = persist_slide_result(
-            result,
-            output_dir=output_dir,
-            file_prefix=f"slide-{index:02d}",
-        )
+        else:
+            batch_errors: list[RuntimeError] = []
+            for index, batch_result in enumerate(batch_results, start=1):
+                if isinstance(batch_result, RuntimeError):
+                    batch_errors.append(batch_result)
+                    continue
+                persisted[index - 1] = (
+                    batch_result,
+                    _persist_deck_slide(batch_result, index=index, output_dir=output_dir),
+                )
+            if batch_errors:
+                console.print(
+                    f"[yellow]{len(batch_errors)} of {len(plan.slides)} slides did not come "
+                    f"back from the batch job ({batch_errors[0]}); "
+                    "generating them individually.[/]",
+                    highlight=False,
+                )
+
+    pending = [index for index, item in enumerate(persisted, start=1) if item is None]
+    if pending:
+        # Slides are independent requests, so each worker generates and writes
+        # its own image while others are still waiting on the network. Project
+        # bookkeeping below then runs in plan order to keep slide order stable.
+        with step_progress(
+            console,
+            f"[bold cyan]Generating {len(pending)} slides[/]",
+            total=len(pending),
+        ) as advance:
+            generated = run_concurrently(
+                [
+                    functools.partial(
+                        _generate_and_persist_slide,
+                        engine,
+                        index=index,
+                        prompt=plan.slides[index - 1].prompt,
+                        style=style,
+                        aspect_ratio=aspect_ratio,
+                        reference_images=reference_images,
+                        output_dir=output_dir,
+                        on_complete=advance,
+                    )
+                    for index in pending
+                ],
+                concurrency=concurrency,
+            )
+        for index, item in zip(pending, generated):
+            persisted[index - 1] = item
+
+    # One directory listing up front; renames below then check names in memory.
+    existing_names = set(os.listdir(output_dir)) if output_dir.is_dir() else set()
+    command_options = _generate_command_options(style=style, aspect_ratio=aspect_ratio)
+    generated_rows: list[dict[str, object]] = []
+    for index, (slide, (result, persisted_path)) in enumerate(
+        zip(plan.slides, persisted), start=1
+    ):
         resolved_path = persisted_path
         slide_id: str | None = None
         if presentation is not None:
@@ -546,9 +715,10 @@ def _generate_planned_slides(
                     reference_files,
                 ),
             )
-            renamed_path = _rename_slide_file(persisted_path, entry.order, entry.id)
-            entry.image_path = str(renamed_path) if renamed_path else None
-            resolved_path = renamed_path or persisted_path
+            resolved_path = _rename_slide_file(
+                persisted_path, entry.order, entry.id, existing_names
+            )
+            entry.image_path = str(resolved_path)
             slide_id = entry.id
 
         generated_rows.append(
@@ -559,8 +729,7 @@ def _generate_planned_slides(
                 "path": str(resolved_path),
                 "generate_command": _generate_command_preview(
                     prompt=slide.prompt,
-                    style=style,
-                    aspect_ratio=aspect_ratio,
+                    options=command_options,
                 ),
             }
         )
@@ -570,40 +739,67 @@ def _generate_planned_slides(
     return generated_rows
 
 
-def _generate_command_preview(
+def _generate_and_persist_slide(
+    engine: NanoBananaSlideEngine,
     *,
+    index: int,
     prompt: str,
     style: ResolvedStyle,
     aspect_ratio: ImageAspectRatio,
-) -> str:
-    escaped_prompt = prompt.replace('"', '\\"')
-    command = f'nanoslides generate "{escaped_prompt}" --aspect-ratio {aspect_ratio.value}'
+    reference_images: list[bytes],
+    output_dir: Path,
+    on_complete: Callable[[], None] | None = None,
+) -> tuple[SlideResult, Path]:
+    result = engine.generate(
+        prompt=prompt,
+        style=style,
+        aspect_ratio=aspect_ratio,
+        reference_images=reference_images,
+    )
+    persisted_path = _persist_deck_slide(result, index=index, output_dir=output_dir)
+    if on_complete is not None:
+        on_complete()
+    return result, persisted_path
+
+
+def _persist_deck_slide(result: SlideResult, *, index: int, output_dir: Path) -> Path:
+    return persist_slide_result(result, output_dir=output_dir, file_prefix=f"slide-{index:02d}")
+
+
+def _generate_command_options(*, style: ResolvedStyle, aspect_ratio: ImageAspectRatio) -> str:
+    options = f"--aspect-ratio {aspect_ratio.value}"
     if style.style_id:
-        command = f"{command} --style-id {style.style_id}"
-    return command
+        options = f"{options} --style-id {style.style_id}"
+    return options
 
 
-def _rename_slide_file(local_path: Path | None, order: int, slide_id: str) -> Path | None:
-    if local_path is None or not local_path.exists():
-        return local_path
-    suffix = local_path.suffix
-    target = local_path.with_name(f"{order}_{slide_id}{suffix}")
-    if target == local_path:
+def _generate_command_preview(*, prompt: str, options: str) -> str:
+    escaped_prompt = prompt.replace('"', '\\"')
+    return f'nanoslides generate "{escaped_prompt}" {options}'
+
+
+def _rename_slide_file(
+    local_path: Path,
+    order: int,
+    slide_id: str,
+    existing_names: set[str],
+) -> Path:
+    """Rename `local_path` to its slide name, tracking taken names in `existing_names`."""
+    name = _reserve_slide_name(existing_names, order, slide_id, local_path.suffix)
+    if name == local_path.name:
         return local_path
-    if target.exists():
-        counter = 2
-        while True:
-            candidate = local_path.with_name(f"{order}_{slide_id}-{counter}{suffix}")
-            if not candidate.exists():
-                target = candidate
-                break
-            counter += 1
+    target = local_path.with_name(name)
     local_path.rename(target)
+    existing_names.discard(local_path.name)
     return target
 
 
-def _resolve_config(ctx: typer.Context) -> GlobalConfig:
-    if ctx.obj and isinstance(ctx.obj.get("config"), GlobalConfig):
-        return ctx.obj["config"]
-    return load_global_config()
+def _reserve_slide_name(existing_names: set[str], order: int, slide_id: str, suffix: str) -> str:
+    name = f"{order}_{slide_id}{suffix}"
+    counter = 2
+    while name in existing_names:
+        name = f"{order}_{slide_id}-{counter}{suffix}"
+        counter += 1
+    existing_names.add(name)
+    return name
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import typer
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 
@@ -26,9 +26,8 @@ def remove_command(
         )
         raise typer.Exit(code=1) from exc
 
-    ordered_slides = presentation.ordered_main_slides
-    target_slide = next((slide for slide in ordered_slides if slide.id == slide_id), None)
-    if target_slide is None:
+    target_slide = presentation.find_slide(slide_id)
+    if target_slide is None or target_slide.is_draft:
         console.print(f"[bold red]Slide '{slide_id}' was not found in {PROJECT_STATE_FILE}.[/]")
         raise typer.Exit(code=1)
 
@@ -36,15 +35,17 @@ def remove_command(
     save_project_state(presentation.to_project_state())
 
     console.print(
-        Panel.fit(
-            f"[bold green]Removed slide[/]\n"
-            f"ID: [bold]{target_slide.id}[/]\n"
-            f"Previous order: [bold]{target_slide.order}[/]",
-            title="nanoslides",
-            border_style="green",
+        Group(
+            Panel.fit(
+                f"[bold green]Removed slide[/]\n"
+                f"ID: [bold]{target_slide.id}[/]\n"
+                f"Previous order: [bold]{target_slide.order}[/]",
+                title="nanoslides",
+                border_style="green",
+            ),
+            _slides_table(presentation.ordered_main_slides),
         )
     )
-    console.print(_slides_table(presentation.ordered_main_slides))
 
 
 def _slides_table(slides: list[SlideEntry]) -> Table:
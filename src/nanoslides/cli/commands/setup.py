@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import MappingProxyType
 
 import click
 import typer
 from click import Choice
 from rich.console import Console
+from rich.live import Live
+from rich.text import Text
 
 from nanoslides.core.config import (
     GEMINI_API_KEY_NAME,
@@ -24,10 +27,31 @@ _PROVIDER_OPTIONS = [
     ("gemini", "Google Gemini", GEMINI_API_KEY_NAME),
 ]
 _PROVIDER_KEYS = [provider_key for _, _, provider_key in _PROVIDER_OPTIONS]
-_PROVIDER_ALIASES = {
-    **{label: provider_key for label, _, provider_key in _PROVIDER_OPTIONS},
-    **{provider_key.lower(): provider_key for provider_key in _PROVIDER_KEYS},
-}
+_PROVIDER_LABELS = MappingProxyType(
+    {provider_key: display_name for _, display_name, provider_key in _PROVIDER_OPTIONS}
+)
+_PROVIDER_ALIASES = MappingProxyType(
+    {
+        **{label: provider_key for label, _, provider_key in _PROVIDER_OPTIONS},
+        **{provider_key.lower(): provider_key for provider_key in _PROVIDER_KEYS},
+    }
+)
+
+# Enter, arrow keys (ANSI and Windows console sequences) and Ctrl-C / Ctrl-D.
+_MENU_KEY_ACTIONS = MappingProxyType(
+    {
+        "\r": "select",
+        "\n": "select",
+        "\x1b[A": "up",
+        "\xe0H": "up",
+        "\x00H": "up",
+        "\x1b[B": "down",
+        "\xe0P": "down",
+        "\x00P": "down",
+        "\x03": "abort",
+        "\x04": "abort",
+    }
+)
 
 
 def _normalize_provider(provider: str) -> str | None:
@@ -35,33 +59,47 @@ def _normalize_provider(provider: str) -> str | None:
 
 
 def _provider_label(provider_key: str) -> str:
-    for _, display_name, candidate_key in _PROVIDER_OPTIONS:
-        if candidate_key == provider_key:
-            return display_name
-    return provider_key.lower()
+    return _PROVIDER_LABELS.get(provider_key, provider_key.lower())
+
+
+def _provider_menu(*, selected_index: int, configured_provider_keys: set[str]) -> Text:
+    lines = ["[bold]Select your provider[/] (↑/↓ then Enter)"]
+    for index, (_, display_name, provider_key) in enumerate(_PROVIDER_OPTIONS):
+        marker = "❯" if index == selected_index else " "
+        configured_label = " \\[configured]" if provider_key in configured_provider_keys else ""
+        lines.append(f"{marker} {display_name}{configured_label}")
+    return Text.from_markup("\n".join(lines))
 
 
 def _select_provider_key(*, configured_provider_keys: set[str]) -> str:
     selected_index = 0
-    while True:
-        click.clear()
-        console.print("[bold]Select your provider[/] (↑/↓ then Enter)")
-        for index, (_, display_name, provider_key) in enumerate(_PROVIDER_OPTIONS):
-            marker = "❯" if index == selected_index else " "
-            configured_label = " [configured]" if provider_key in configured_provider_keys else ""
-            console.print(f"{marker} {display_name}{configured_label}")
-
-        key = click.getchar()
-        if key in ("\r", "\n"):
-            return _PROVIDER_OPTIONS[selected_index][2]
-        if key in ("\x1b[A", "\xe0H", "\x00H"):
-            selected_index = (selected_index - 1) % len(_PROVIDER_OPTIONS)
-            continue
-        if key in ("\x1b[B", "\xe0P", "\x00P"):
-            selected_index = (selected_index + 1) % len(_PROVIDER_OPTIONS)
-            continue
-        if key in ("\x03", "\x04"):
-            raise typer.Abort()
+    # Live redraws the menu in place, so arrow keys only rewrite the menu lines
+    # instead of clearing the whole screen.
+    with Live(
+        _provider_menu(
+            selected_index=selected_index,
+            configured_provider_keys=configured_provider_keys,
+        ),
+        console=console,
+        auto_refresh=False,
+    ) as live:
+        while True:
+            action = _MENU_KEY_ACTIONS.get(click.getchar())
+            if action is None:
+                continue
+            if action == "select":
+                return _PROVIDER_OPTIONS[selected_index][2]
+            if action == "abort":
+                raise typer.Abort()
+            step = -1 if action == "up" else 1
+            selected_index = (selected_index + step) % len(_PROVIDER_OPTIONS)
+            live.update(
+                _provider_menu(
+                    selected_index=selected_index,
+                    configured_provider_keys=configured_provider_keys,
+                ),
+                refresh=True,
+            )
 
 
 def setup_command(
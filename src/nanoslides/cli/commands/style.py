@@ -1,6 +1,8 @@
 """Style command group."""
 
+import os
 import sys
+from collections.abc import Iterable
 from pathlib import Path
 
 import typer
@@ -11,6 +13,7 @@ from rich.prompt import Confirm, Prompt
 from rich.table import Table
 
 from nanoslides.cli.errors import render_cli_error
+from nanoslides.cli.progress import status
 from nanoslides.core.config import get_gemini_api_key, load_global_config
 from nanoslides.core.style import (
     GLOBAL_STYLES_PATH,
@@ -28,6 +31,7 @@ from nanoslides.core.style_steal import (
     infer_project_style_from_source,
     load_style_steal_source,
 )
+from nanoslides.utils.io import find_missing_files
 
 style_app = typer.Typer(
     help="Style management commands.",
@@ -116,9 +120,7 @@ def style_create_command(
         )
 
     if resolved_global_scope:
-        resolved_reference_images = [
-            str(Path(path).expanduser().resolve()) for path in resolved_reference_images
-        ]
+        resolved_reference_images = _resolve_reference_paths(resolved_reference_images)
 
     style = StyleDefinition(
         base_prompt=resolved_base_prompt,
@@ -219,7 +221,7 @@ def style_edit_command(
         resolved_reference_images = (
             existing.reference_images
             if slides_base_reference is None
-            else [str(path.expanduser().resolve()) for path in slides_base_reference]
+            else _resolve_reference_paths(slides_base_reference)
         )
         resolved_reference_comments = (
             existing.reference_comments
@@ -377,7 +379,7 @@ def _collect_style_inputs(
         ).strip()
         if maybe_image:
             image_path = Path(maybe_image).expanduser()
-            if not image_path.exists() or not image_path.is_file():
+            if not image_path.is_file():
                 raise ValueError(f"Reference image not found: {image_path}")
             resolved_reference_images = [str(image_path)]
 
@@ -392,16 +394,25 @@ def _collect_style_inputs(
 
 
 def _parse_slides_base_reference_input(raw_value: str) -> list[str]:
-    references: list[str] = []
-    for token in raw_value.split(","):
-        cleaned = token.strip()
-        if not cleaned:
-            continue
-        path = Path(cleaned).expanduser()
-        if not path.exists() or not path.is_file():
-            raise ValueError(f"Reference image not found: {path}")
-        references.append(str(path.resolve()))
-    return references
+    tokens = dict.fromkeys(token.strip() for token in raw_value.split(","))
+    paths = [os.path.expanduser(token) for token in tokens if token]
+    missing = find_missing_files(paths)
+    if missing:
+        raise ValueError(f"Reference image not found: {missing[0]}")
+    return list(dict.fromkeys(os.path.realpath(path) for path in paths))
+
+
+def _resolve_reference_paths(paths: Iterable[str | Path]) -> list[str]:
+    """Make reference image paths absolute, resolving each parent directory once."""
+    resolved_parents: dict[str, str] = {}
+    resolved: list[str] = []
+    for path in paths:
+        parent, name = os.path.split(os.path.expanduser(path))
+        resolved_parent = resolved_parents.get(parent)
+        if resolved_parent is None:
+            resolved_parent = resolved_parents[parent] = os.path.realpath(parent or os.curdir)
+        resolved.append(os.path.join(resolved_parent, name))
+    return resolved
 
 
 @style_app.command("steal")
@@ -446,8 +457,9 @@ def style_steal_command(
             api_key=api_key,
             timeout_seconds=float(timeout_seconds),
         )
-        with console.status(
-            f"[bold cyan]Analyzing style with Gemini 3 Pro (timeout: {timeout_seconds}s)...[/]"
+        with status(
+            console,
+            f"[bold cyan]Analyzing style with Gemini 3 Pro (timeout: {timeout_seconds}s)...[/]",
         ):
             inferred_style = infer_project_style_from_source(
                 analyzer=analyzer,
@@ -552,8 +564,9 @@ def style_generate_command(
             api_key=api_key,
             timeout_seconds=float(timeout_seconds),
         )
-        with console.status(
-            f"[bold cyan]Generating style with Gemini 3 Pro (timeout: {timeout_seconds}s)...[/]"
+        with status(
+            console,
+            f"[bold cyan]Generating style with Gemini 3 Pro (timeout: {timeout_seconds}s)...[/]",
         ):
             inferred_style = infer_project_style_from_instruction(
                 analyzer=analyzer,
@@ -672,9 +685,7 @@ def _style_definition_for_global(project_style: ProjectStyleConfig) -> StyleDefi
     return StyleDefinition(
         base_prompt=project_style.base_prompt,
         negative_prompt=project_style.negative_prompt,
-        reference_images=[
-            str(Path(path).expanduser().resolve()) for path in project_style.reference_images
-        ],
+        reference_images=_resolve_reference_paths(project_style.reference_images),
         reference_comments=project_style.reference_comments,
     )
 
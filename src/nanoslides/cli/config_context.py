@@ -0,0 +1,14 @@
+"""Shared access to the global config loaded by the CLI callback."""
+
+from __future__ import annotations
+
+import typer
+
+from nanoslides.core.config import GlobalConfig, load_global_config
+
+
+def resolve_config(ctx: typer.Context) -> GlobalConfig:
+    """Return the config stored on `ctx` by the root callback, loading it if absent."""
+    if ctx.obj and isinstance(ctx.obj.get("config"), GlobalConfig):
+        return ctx.obj["config"]
+    return load_global_config()
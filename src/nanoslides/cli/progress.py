@@ -0,0 +1,58 @@
+"""CLI progress indicator helpers."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+import contextlib
+from typing import ContextManager
+
+from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+)
+
+
+def status(console: Console, message: str, *, animate: bool = True) -> ContextManager[object]:
+    """Show a spinner while work runs, or print `message` once when not animating.
+
+    The animated spinner (a Rich Live refresh thread) is only used on terminals;
+    piped, CI and `--no-interactive` runs get a single static line instead.
+    """
+    if not animate or not console.is_terminal:
+        console.print(message)
+        return contextlib.nullcontext()
+    return console.status(message, spinner="dots")
+
+
+@contextlib.contextmanager
+def step_progress(
+    console: Console,
+    message: str,
+    *,
+    total: int,
+    animate: bool = True,
+) -> Iterator[Callable[[], None]]:
+    """Show one progress bar for `total` steps and yield a callback that advances it.
+
+    The callback is safe to call from worker threads. Off a terminal the message
+    is printed once and the callback does nothing.
+    """
+    if not animate or not console.is_terminal:
+        console.print(message)
+        yield lambda: None
+        return
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        console=console,
+    ) as progress:
+        task_id = progress.add_task(message, total=total)
+        yield lambda: progress.advance(task_id)
@@ -49,14 +49,20 @@ def inject_reference_file_context(text: str, reference_files: list[Path]) -> str
 def add_reference_file_metadata(
     metadata: dict[str, object],
     reference_files: list[Path],
+    *,
+    inplace: bool = False,
 ) -> dict[str, object]:
-    """Record reference file paths in slide metadata."""
+    """Record reference file paths in slide metadata.
+
+    With `inplace=True` the given dict is updated and returned instead of copied.
+    """
     if not reference_files:
         return metadata
-    return {
-        **metadata,
-        "reference_files": [str(path) for path in reference_files],
-    }
+    reference_paths = [str(path) for path in reference_files]
+    if inplace:
+        metadata["reference_files"] = reference_paths
+        return metadata
+    return {**metadata, "reference_files": reference_paths}
 
 
 def _read_text_file(path: Path) -> tuple[str, bool]:
@@ -0,0 +1,55 @@
+"""Helpers for locating project slides by ID or image path."""
+
+from __future__ import annotations
+
+import functools
+import os
+from pathlib import Path
+
+from nanoslides.core.project import SlideEntry
+
+
+def find_slide_by_path(slides: list[SlideEntry], image_path: Path) -> SlideEntry | None:
+    """Return the first slide whose image resolves to `image_path`."""
+    target_name = image_path.name.lower()
+    normalized_target: str | None = None
+    for slide in slides:
+        if not slide.image_path:
+            continue
+        # Cheap filename prefilter so only plausible matches pay for resolve().
+        if os.path.basename(slide.image_path).lower() != target_name:
+            continue
+        if normalized_target is None:
+            normalized_target = normalize_path(image_path)
+        if normalize_path(resolve_slide_image_path(slide.image_path)) == normalized_target:
+            return slide
+    return None
+
+
+def resolve_slide_image_path(raw_path: str) -> Path:
+    """Resolve a stored slide image path against the current directory."""
+    return _resolve_slide_image_path_cached(os.getcwd(), raw_path)
+
+
+def normalize_path(path: Path) -> str:
+    """Return a resolved, case-normalized path string for comparisons."""
+    return _normalize_path_cached(str(path))
+
+
+def clear_path_caches() -> None:
+    """Forget memoized path resolutions (call when the filesystem may have changed)."""
+    _resolve_slide_image_path_cached.cache_clear()
+    _normalize_path_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_slide_image_path_cached(cwd: str, raw_path: str) -> Path:
+    image_path = Path(raw_path).expanduser()
+    if not image_path.is_absolute():
+        image_path = Path(cwd) / image_path
+    return image_path.resolve()
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_path_cached(path_str: str) -> str:
+    return os.path.normcase(str(Path(path_str).resolve()))
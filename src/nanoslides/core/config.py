@@ -14,6 +14,8 @@ _PROVIDER_DEFAULT_ENGINES = {
     GEMINI_API_KEY_NAME: "nanobanana",
     OPENAI_API_KEY_NAME: "gpt-image",
 }
+# Parsed config files keyed by resolved path, validated against (mtime_ns, size).
+_CONFIG_CACHE: dict[str, tuple[tuple[int, int], GlobalConfig]] = {}
 
 
 class GlobalConfig(BaseModel):
@@ -26,16 +28,25 @@ class GlobalConfig(BaseModel):
 
 def load_global_config(path: Path = GLOBAL_CONFIG_PATH) -> GlobalConfig:
     """Load global config from TOML, returning defaults when missing."""
-    if not path.exists():
+    try:
+        stat_result = path.stat()
+    except FileNotFoundError:
         return GlobalConfig()
 
-    contents = path.read_text(encoding="utf-8")
-    data = tomllib.loads(contents)
-    return GlobalConfig.model_validate(data)
+    cache_key = str(path.resolve())
+    signature = (stat_result.st_mtime_ns, stat_result.st_size)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is None or cached[0] != signature:
+        contents = path.read_text(encoding="utf-8")
+        data = tomllib.loads(contents)
+        cached = (signature, GlobalConfig.model_validate(data))
+        _CONFIG_CACHE[cache_key] = cached
+    return cached[1].model_copy(deep=True)
 
 
 def save_global_config(config: GlobalConfig, path: Path = GLOBAL_CONFIG_PATH) -> None:
     """Persist global config to TOML."""
+    _CONFIG_CACHE.clear()
     path.parent.mkdir(parents=True, exist_ok=True)
     lines = [
         f'default_engine = "{_escape_toml_string(config.default_engine)}"',
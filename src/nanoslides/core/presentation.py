@@ -3,11 +3,20 @@
 from __future__ import annotations
 
 from datetime import datetime
+from pathlib import Path
+from types import TracebackType
 from typing import Any
 
 from pydantic import BaseModel, Field
 
-from nanoslides.core.project import ProjectState, SlideEntry, dedupe_slide_id, suggest_slide_id
+from nanoslides.core.project import (
+    PROJECT_STATE_FILE,
+    ProjectState,
+    SlideEntry,
+    dedupe_slide_id,
+    save_project_state,
+    suggest_slide_id,
+)
 
 
 class Presentation(BaseModel):
@@ -50,6 +59,10 @@ class Presentation(BaseModel):
             key=lambda slide: (slide.order, slide.id),
         )
 
+    def batch(self, path: Path = PROJECT_STATE_FILE) -> ProjectStateWriter:
+        """Return a writer that saves this presentation once when its context exits."""
+        return ProjectStateWriter(self, path)
+
     def find_slide(self, slide_id: str) -> SlideEntry | None:
         """Find a slide by ID."""
         return next((slide for slide in self.slides if slide.id == slide_id), None)
@@ -84,10 +97,12 @@ class Presentation(BaseModel):
 
     def remove_slide(self, slide_id: str) -> SlideEntry | None:
         """Remove a slide and compact the remaining ordering."""
-        target = self.find_slide(slide_id)
-        if target is None:
+        index = next(
+            (idx for idx, slide in enumerate(self.slides) if slide.id == slide_id), None
+        )
+        if index is None:
             return None
-        self.slides = [slide for slide in self.slides if slide.id != slide_id]
+        target = self.slides.pop(index)
         if not target.is_draft:
             self._replace_non_draft_slides(self.ordered_main_slides)
         return target
@@ -99,6 +114,8 @@ class Presentation(BaseModel):
         if index is None:
             raise ValueError(f"Slide '{slide_id}' was not found.")
         current_pos = index + 1
+        if current_pos == new_pos:
+            return current_pos, new_pos
         moving = ordered.pop(index)
         ordered.insert(new_pos - 1, moving)
         self._replace_non_draft_slides(ordered)
@@ -150,3 +167,42 @@ class Presentation(BaseModel):
         for index, slide in enumerate(ordered, start=1):
             slide.order = index
         self.slides = ordered + drafts
+
+
+class ProjectStateWriter:
+    """Coalesce project state writes for a presentation into a single flush.
+
+    Callers mark the state dirty after each mutation; the state is written at
+    most once when the context exits, or earlier through ``flush(force=True)``.
+    """
+
+    def __init__(
+        self,
+        presentation: Presentation | None,
+        path: Path = PROJECT_STATE_FILE,
+    ) -> None:
+        self.presentation = presentation
+        self.path = path
+        self._dirty = False
+
+    def __enter__(self) -> ProjectStateWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.flush()
+
+    def mark_dirty(self) -> None:
+        """Record that the presentation changed since the last flush."""
+        self._dirty = True
+
+    def flush(self, *, force: bool = False) -> None:
+        """Write the presentation state if it changed (or unconditionally when forced)."""
+        if self.presentation is None or not (self._dirty or force):
+            return
+        save_project_state(self.presentation.to_project_state(), self.path)
+        self._dirty = False
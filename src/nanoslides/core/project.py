@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 from datetime import datetime
-import json
+import os
 from pathlib import Path
 import re
+import stat
+import tempfile
 from typing import Any
 import unicodedata
 
 from pydantic import BaseModel, Field, field_validator
 import yaml
 
+from nanoslides.utils.jsonio import dumps_pretty, loads
+
 PROJECT_STATE_FILE = Path("slides.json")
 LEGACY_PROJECT_STATE_FILE = Path("slides.yaml")
 PROJECT_STATE_SCHEMA_VERSION = 1
@@ -34,6 +38,8 @@ _SLIDE_ID_STOPWORDS = {
     "use",
     "with",
 }
+# Parsed project states keyed by resolved path, validated against (mtime_ns, size).
+_STATE_CACHE: dict[str, tuple[tuple[int, int], ProjectState]] = {}
 
 
 def new_slide_id() -> str:
@@ -110,6 +116,13 @@ class ProjectState(BaseModel):
 def load_project_state(path: Path = PROJECT_STATE_FILE) -> ProjectState:
     """Load local project state from disk."""
     source_path = _resolve_project_state_path(path)
+    stat_result = source_path.stat()
+    cache_key = str(source_path.resolve())
+    signature = (stat_result.st_mtime_ns, stat_result.st_size)
+    cached = _STATE_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1].model_copy(deep=True)
+
     raw_data = _load_state_payload(source_path)
     data = raw_data if raw_data is not None else {}
     slides = data.get("slides")
@@ -129,23 +142,66 @@ def load_project_state(path: Path = PROJECT_STATE_FILE) -> ProjectState:
             slide["id"] = unique_id
             existing_ids.add(unique_id)
     state = ProjectState.model_validate(data)
+    # Keep slides in display order so later (order, id) sorts see a presorted
+    # list, which Python's sort handles in linear time.
+    state.slides.sort(key=lambda slide: (slide.order, slide.id))
     _migrate_project_state(path=path, source_path=source_path, state=state)
+    if source_path == path:
+        _STATE_CACHE[cache_key] = (signature, state.model_copy(deep=True))
     return state
 
 
 def save_project_state(state: ProjectState, path: Path = PROJECT_STATE_FILE) -> None:
     """Write local project state to disk."""
+    _STATE_CACHE.clear()
     serialized = state.model_dump(mode="json")
     path.parent.mkdir(parents=True, exist_ok=True)
     if path.suffix.lower() == ".json":
-        path.write_text(json.dumps(serialized, indent=2) + "\n", encoding="utf-8")
+        payload = dumps_pretty(serialized)
     else:
-        path.write_text(yaml.safe_dump(serialized, sort_keys=False), encoding="utf-8")
+        payload = yaml.safe_dump(serialized, sort_keys=False).encode("utf-8")
+    _write_atomic(path, payload)
     legacy_path = _legacy_project_state_path(path)
     if path.suffix.lower() == ".json" and legacy_path.exists():
         legacy_path.unlink()
 
 
+def _write_atomic(path: Path, payload: bytes) -> None:
+    if _file_has_contents(path, payload):
+        return
+    # A unique temporary name keeps concurrent savers from clobbering each
+    # other's half-written files; the last os.replace wins.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(payload)
+        os.chmod(tmp_name, _replacement_mode(path))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _replacement_mode(path: Path) -> int:
+    """Return the permission bits the rewritten file should keep."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        # mkstemp creates 0600 files; give new files the usual umask-based mode.
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _file_has_contents(path: Path, payload: bytes) -> bool:
+    try:
+        if path.stat().st_size != len(payload):
+            return False
+        return path.read_bytes() == payload
+    except FileNotFoundError:
+        return False
+
+
 def _resolve_project_state_path(path: Path) -> Path:
     if path.exists():
         return path
@@ -160,10 +216,9 @@ def _legacy_project_state_path(path: Path) -> Path:
 
 
 def _load_state_payload(path: Path) -> Any:
-    raw_text = path.read_text(encoding="utf-8")
     if path.suffix.lower() == ".json":
-        return json.loads(raw_text)
-    return yaml.safe_load(raw_text)
+        return loads(path.read_bytes())
+    return yaml.safe_load(path.read_text(encoding="utf-8"))
 
 
 def _migrate_project_state(*, path: Path, source_path: Path, state: ProjectState) -> None:
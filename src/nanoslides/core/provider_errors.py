@@ -6,6 +6,8 @@ import re
 from typing import Any
 
 _STATUS_CODE_PATTERN = re.compile(r"\b(4\d{2}|5\d{2})\b")
+_RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+_RETRYABLE_MESSAGE_MARKERS = ("quota", "rate limit", "resource exhausted", "resource_exhausted")
 
 
 def extract_status_code(exc: BaseException) -> int | None:
@@ -55,3 +57,13 @@ def is_service_unavailable_error(exc: BaseException) -> bool:
         if part
     ).lower()
     return "service unavailable" in message or "temporarily unavailable" in message
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """Return True for transient provider failures (rate limits, 5xx outages)."""
+    if extract_status_code(exc) in _RETRYABLE_STATUS_CODES:
+        return True
+    if is_service_unavailable_error(exc):
+        return True
+    message = f"{getattr(exc, 'status', '')} {exc}".lower()
+    return any(marker in message for marker in _RETRYABLE_MESSAGE_MARKERS)
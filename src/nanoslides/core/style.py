@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 from pathlib import Path
+from typing import TypeVar
 
 from pydantic import BaseModel, Field
 
 PROJECT_STYLE_PATH = Path("style.json")
 GLOBAL_STYLES_PATH = Path.home() / ".nanoslides" / "styles.json"
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+# Parsed style files keyed by resolved path, validated against (mtime_ns, size).
+_STYLE_CACHE: dict[str, tuple[tuple[int, int], BaseModel]] = {}
 
 
 class StyleDefinition(BaseModel):
@@ -43,9 +49,9 @@ def merge_style_references(style: ResolvedStyle, references: list[Path]) -> Reso
     if not references:
         return style
 
-    merged_reference_images = _unique(
-        [*style.reference_images, *(str(path.expanduser().resolve()) for path in references)]
-    )
+    cwd = os.getcwd()
+    resolved_references = [_resolve_reference_path(cwd, str(path)) for path in references]
+    merged_reference_images = _unique([*style.reference_images, *resolved_references])
     return style.model_copy(update={"reference_images": merged_reference_images})
 
 
@@ -53,7 +59,7 @@ def load_project_style(path: Path = PROJECT_STYLE_PATH) -> ProjectStyleConfig |
     """Load project style config when present."""
     if not path.exists():
         return None
-    return ProjectStyleConfig.model_validate(_load_json(path))
+    return _load_model_cached(path, ProjectStyleConfig)
 
 
 def save_project_style(style: ProjectStyleConfig, path: Path = PROJECT_STYLE_PATH) -> None:
@@ -65,7 +71,7 @@ def load_global_styles(path: Path = GLOBAL_STYLES_PATH) -> GlobalStylesConfig:
     """Load global style registry, returning defaults when missing."""
     if not path.exists():
         return GlobalStylesConfig()
-    return GlobalStylesConfig.model_validate(_load_json(path))
+    return _load_model_cached(path, GlobalStylesConfig)
 
 
 def save_global_styles(styles: GlobalStylesConfig, path: Path = GLOBAL_STYLES_PATH) -> None:
@@ -139,15 +145,31 @@ def _resolve_reference_images(paths: list[str], base_dir: Path) -> list[str]:
 
 
 def _unique(values: list[str]) -> list[str]:
-    seen: set[str] = set()
-    result: list[str] = []
-    for value in values:
-        normalized = value.strip()
-        if not normalized or normalized in seen:
-            continue
-        seen.add(normalized)
-        result.append(normalized)
-    return result
+    return [value for value in dict.fromkeys(value.strip() for value in values) if value]
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_reference_path(cwd: str, raw_path: str) -> str:
+    # Keyed on cwd as well so relative references stay correct after chdir().
+    path = Path(raw_path).expanduser()
+    if not path.is_absolute():
+        path = Path(cwd) / path
+    return str(path.resolve())
+
+
+def _load_model_cached(path: Path, model_type: type[_ModelT]) -> _ModelT:
+    stat_result = path.stat()
+    cache_key = f"{model_type.__name__}:{path.resolve()}"
+    signature = (stat_result.st_mtime_ns, stat_result.st_size)
+    cached = _STYLE_CACHE.get(cache_key)
+    if cached is None or cached[0] != signature:
+        cached = (signature, model_type.model_validate(_load_json(path)))
+        _STYLE_CACHE[cache_key] = cached
+    return cached[1].model_copy(deep=True)  # type: ignore[return-value]
+
+
+def _invalidate_style_caches() -> None:
+    _STYLE_CACHE.clear()
 
 
 def _load_json(path: Path) -> dict[str, object]:
@@ -155,5 +177,6 @@ def _load_json(path: Path) -> dict[str, object]:
 
 
 def _save_json(path: Path, payload: dict[str, object]) -> None:
+    _invalidate_style_caches()
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
@@ -222,7 +222,7 @@ def infer_project_style_from_instruction(
 def load_style_steal_source(path: Path) -> StyleStealSource:
     """Load and validate a style-steal source file."""
     source_path = path.expanduser().resolve()
-    if not source_path.exists() or not source_path.is_file():
+    if not source_path.is_file():
         raise ValueError(f"Style source file not found: {source_path}")
 
     mime_type = _guess_mime_type(source_path)
@@ -287,16 +287,16 @@ def _parse_json_response(response: Any) -> dict[str, Any]:
 
 
 def _response_text_parts(response: Any) -> list[str]:
-    text_parts: list[str] = []
-    candidates = getattr(response, "candidates", None) or []
-    for candidate in candidates:
-        content = getattr(candidate, "content", None)
-        parts = getattr(content, "parts", None) or []
-        for part in parts:
-            text = getattr(part, "text", None)
-            if text:
-                text_parts.append(str(text))
-    return text_parts
+    try:
+        return [
+            part.text
+            for candidate in response.candidates or []
+            if candidate.content is not None
+            for part in candidate.content.parts or []
+            if part.text
+        ]
+    except AttributeError:
+        return []
 
 
 _STYLE_STEAL_PROMPT = """
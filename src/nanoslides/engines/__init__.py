@@ -1,6 +1,31 @@
 """Engine implementations for nanoslides."""
 
-from nanoslides.engines.nanobanana import NanoBananaModel, NanoBananaSlideEngine
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from nanoslides.engines.nanobanana import NanoBananaSlideEngine
+    from nanoslides.engines.nanobanana_models import NanoBananaModel
+
+# Resolved on first access so importing the enums does not load the Gemini SDK.
+_LAZY = {
+    "NanoBananaModel": "nanoslides.engines.nanobanana_models",
+    "NanoBananaSlideEngine": "nanoslides.engines.nanobanana",
+}
 
 __all__ = ["NanoBananaModel", "NanoBananaSlideEngine"]
 
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
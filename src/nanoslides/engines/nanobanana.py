@@ -3,34 +3,33 @@
 from __future__ import annotations
 
 import base64
-from enum import Enum
+import functools
+import io
 import os
 from pathlib import Path
+import time
 from typing import Any
 
 from google import genai
 from google.genai import types
+from PIL import Image
 
 from nanoslides.core.interfaces import SlideEngine, SlideResult
 from nanoslides.core.provider_errors import is_service_unavailable_error
 from nanoslides.core.style import ResolvedStyle
+from nanoslides.engines.nanobanana_models import ImageAspectRatio, NanoBananaModel
+from nanoslides.utils.images import sniff_image_mime_type
+from nanoslides.utils.io import read_files_concurrently
 
-_MODEL_MAP = {
-    "flash": "gemini-2.5-flash-image",
-    "pro": "gemini-3-pro-image-preview",
-}
 _SUPPORTED_IMAGE_MIME_TYPES = {"image/png", "image/jpeg", "image/webp"}
-
-
-class NanoBananaModel(str, Enum):
-    """Supported Nano Banana model selectors."""
-
-    FLASH = "flash"
-    PRO = "pro"
-
-    @property
-    def api_model(self) -> str:
-        return _MODEL_MAP[self.value]
+_MAX_REFERENCE_IMAGE_SIZE = (1024, 1024)
+_BATCH_TERMINAL_STATES = {
+    types.JobState.JOB_STATE_SUCCEEDED,
+    types.JobState.JOB_STATE_FAILED,
+    types.JobState.JOB_STATE_CANCELLED,
+    types.JobState.JOB_STATE_EXPIRED,
+    types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+}
 
 
 def _fallback_model_for(model: NanoBananaModel) -> NanoBananaModel | None:
@@ -39,21 +38,6 @@ def _fallback_model_for(model: NanoBananaModel) -> NanoBananaModel | None:
     return None
 
 
-class ImageAspectRatio(str, Enum):
-    """Supported image aspect ratios for generation."""
-
-    RATIO_1_1 = "1:1"
-    RATIO_2_3 = "2:3"
-    RATIO_3_2 = "3:2"
-    RATIO_3_4 = "3:4"
-    RATIO_4_3 = "4:3"
-    RATIO_4_5 = "4:5"
-    RATIO_5_4 = "5:4"
-    RATIO_9_16 = "9:16"
-    RATIO_16_9 = "16:9"
-    RATIO_21_9 = "21:9"
-
-
 class NanoBananaSlideEngine(SlideEngine):
     """SlideEngine backed by Gemini Nano Banana image generation."""
 
@@ -63,9 +47,26 @@ class NanoBananaSlideEngine(SlideEngine):
         model: NanoBananaModel = NanoBananaModel.FLASH,
         api_key: str | None = None,
         output_dir: Path | str | None = None,
+        client: genai.Client | None = None,
     ) -> None:
         self.model = model
-        self._client = genai.Client(api_key=_resolve_api_key(api_key))
+        self._client = client or shared_gemini_client(_resolve_api_key(api_key))
+
+    def prepare_reference_images(self, style: ResolvedStyle | None) -> list[bytes]:
+        """Read and downscale style reference images once for reuse across calls.
+
+        Pass the result as `reference_images` to `generate`/`edit` so repeated
+        requests do not re-read the files.
+        """
+        if style is None:
+            return []
+        paths: list[Path] = []
+        for raw_path in style.reference_images:
+            path = Path(raw_path).expanduser()
+            if not path.exists():
+                raise ValueError(f"Style reference image not found: {path}")
+            paths.append(path)
+        return [_downscale_reference_image(data) for data in read_files_concurrently(paths)]
 
     def generate(
         self,
@@ -73,11 +74,12 @@ class NanoBananaSlideEngine(SlideEngine):
         style_id: str = "default",
         style: ResolvedStyle | None = None,
         aspect_ratio: ImageAspectRatio = ImageAspectRatio.RATIO_16_9,
+        reference_images: list[bytes] | None = None,
     ) -> SlideResult:
         resolved_style = style or _style_from_style_id(style_id)
         revised_prompt = _build_prompt(prompt, resolved_style)
         contents: list[Any] = [revised_prompt]
-        contents.extend(_style_reference_parts(resolved_style))
+        contents.extend(_style_reference_parts(resolved_style, reference_images))
 
         response, used_model = self._generate_content_with_fallback(
             contents=contents,
@@ -93,6 +95,92 @@ class NanoBananaSlideEngine(SlideEngine):
             used_model=used_model,
         )
 
+    def generate_batch(
+        self,
+        prompts: list[str],
+        style_id: str = "default",
+        style: ResolvedStyle | None = None,
+        aspect_ratio: ImageAspectRatio = ImageAspectRatio.RATIO_16_9,
+        reference_images: list[bytes] | None = None,
+        *,
+        poll_interval: float = 10.0,
+        max_poll_interval: float = 120.0,
+        timeout: float | None = None,
+    ) -> list[SlideResult | RuntimeError]:
+        """Generate one slide per prompt through a single Gemini batch job.
+
+        Batch jobs are cheaper than online requests but can take minutes to
+        hours to complete; this call blocks, polling with exponential backoff.
+        Each entry of the returned list is either the slide for that prompt or
+        a RuntimeError saying why it did not come back, so callers can
+        regenerate only the failed prompts. If `timeout` seconds pass or the
+        wait is interrupted, the remote job is cancelled and the error re-raised.
+        """
+        resolved_style = style or _style_from_style_id(style_id)
+        reference_parts = _style_reference_parts(resolved_style, reference_images)
+        config = types.GenerateContentConfig(
+            response_modalities=["TEXT", "IMAGE"],
+            image_config=types.ImageConfig(aspect_ratio=aspect_ratio.value),
+        )
+        revised_prompts = [_build_prompt(prompt, resolved_style) for prompt in prompts]
+        job = self._client.batches.create(
+            model=self.model.api_model,
+            src=[
+                types.InlinedRequest(contents=[revised_prompt, *reference_parts], config=config)
+                for revised_prompt in revised_prompts
+            ],
+            config=types.CreateBatchJobConfig(display_name="nanoslides"),
+        )
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = poll_interval
+        try:
+            while job.state not in _BATCH_TERMINAL_STATES:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"NanoBanana batch job {job.name} did not finish within {timeout:g}s."
+                    )
+                remaining = delay if deadline is None else deadline - time.monotonic()
+                time.sleep(max(min(delay, remaining), 0))
+                delay = min(delay * 2, max_poll_interval)
+                job = self._client.batches.get(name=job.name)
+        except (KeyboardInterrupt, TimeoutError):
+            self._client.batches.cancel(name=job.name)
+            raise
+
+        inlined_responses = (job.dest.inlined_responses if job.dest else None) or []
+        if len(inlined_responses) != len(revised_prompts):
+            # Responses are matched to prompts by position, so a list of the
+            # wrong length cannot be attributed to individual prompts.
+            return [
+                RuntimeError(
+                    f"NanoBanana batch job {job.name} finished as {job.state} with "
+                    f"{len(inlined_responses)} responses for {len(revised_prompts)} requests."
+                )
+                for _ in revised_prompts
+            ]
+
+        results: list[SlideResult | RuntimeError] = []
+        for revised_prompt, inlined in zip(revised_prompts, inlined_responses):
+            if inlined.error is not None:
+                results.append(
+                    RuntimeError(f"NanoBanana batch request failed: {inlined.error.message}")
+                )
+                continue
+            try:
+                result = self._to_slide_result(
+                    inlined.response,
+                    revised_prompt=revised_prompt,
+                    aspect_ratio=aspect_ratio,
+                    used_model=self.model,
+                )
+            except RuntimeError as exc:
+                results.append(exc)
+                continue
+            result.metadata["batch_job"] = job.name
+            results.append(result)
+        return results
+
     def edit(
         self,
         image: bytes,
@@ -100,11 +188,12 @@ class NanoBananaSlideEngine(SlideEngine):
         style_id: str = "default",
         style: ResolvedStyle | None = None,
         mask: dict[str, Any] | None = None,
+        reference_images: list[bytes] | None = None,
     ) -> SlideResult:
         resolved_style = style or _style_from_style_id(style_id)
         revised_prompt = _build_prompt(instruction, resolved_style, is_edit=True)
         contents: list[Any] = [revised_prompt, _bytes_part(image)]
-        contents.extend(_style_reference_parts(resolved_style))
+        contents.extend(_style_reference_parts(resolved_style, reference_images))
         response, used_model = self._generate_content_with_fallback(
             contents=contents,
             config=types.GenerateContentConfig(response_modalities=["TEXT", "IMAGE"]),
@@ -196,6 +285,16 @@ class NanoBananaSlideEngine(SlideEngine):
         raise RuntimeError("NanoBanana request failed before receiving a response.")
 
 
+@functools.lru_cache(maxsize=4)
+def shared_gemini_client(api_key: str) -> genai.Client:
+    """Return the process-wide Gemini client for `api_key`.
+
+    Engines and the deck planner share it, and so one connection pool; callers
+    needing different transport settings pass `http_options` per request.
+    """
+    return genai.Client(api_key=api_key)
+
+
 def _resolve_api_key(api_key: str | None) -> str:
     resolved_key = api_key or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
     if resolved_key:
@@ -239,7 +338,12 @@ def _build_prompt(
     return "\n\n".join(section for section in sections if section)
 
 
-def _style_reference_parts(style: ResolvedStyle | None) -> list[types.Part]:
+def _style_reference_parts(
+    style: ResolvedStyle | None,
+    reference_images: list[bytes] | None = None,
+) -> list[types.Part]:
+    if reference_images is not None:
+        return [_bytes_part(image_bytes) for image_bytes in reference_images]
     if style is None:
         return []
 
@@ -252,6 +356,23 @@ def _style_reference_parts(style: ResolvedStyle | None) -> list[types.Part]:
     return parts
 
 
+def _downscale_reference_image(image_bytes: bytes) -> bytes:
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            if (
+                image.width <= _MAX_REFERENCE_IMAGE_SIZE[0]
+                and image.height <= _MAX_REFERENCE_IMAGE_SIZE[1]
+            ):
+                return image_bytes
+            image.thumbnail(_MAX_REFERENCE_IMAGE_SIZE, Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, format="PNG")
+    except OSError:
+        # Not an image Pillow understands; let the provider decide.
+        return image_bytes
+    return buffer.getvalue()
+
+
 def _style_from_style_id(style_id: str) -> ResolvedStyle | None:
     normalized = style_id.strip()
     if not normalized or normalized == "default":
@@ -260,7 +381,8 @@ def _style_from_style_id(style_id: str) -> ResolvedStyle | None:
 
 
 def _bytes_part(image_bytes: bytes) -> types.Part:
-    return types.Part.from_bytes(data=image_bytes, mime_type="image/png")
+    mime_type = sniff_image_mime_type(image_bytes) or "image/png"
+    return types.Part.from_bytes(data=image_bytes, mime_type=mime_type)
 
 
 def _response_parts(response: Any) -> list[Any]:
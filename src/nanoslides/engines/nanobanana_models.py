@@ -0,0 +1,40 @@
+"""Lightweight Nano Banana option enums.
+
+Kept separate from the engine so the CLI can build its options without
+importing the Gemini SDK.
+"""
+
+from __future__ import annotations
+
+from enum import Enum
+
+_MODEL_MAP = {
+    "flash": "gemini-2.5-flash-image",
+    "pro": "gemini-3-pro-image-preview",
+}
+
+
+class NanoBananaModel(str, Enum):
+    """Supported Nano Banana model selectors."""
+
+    FLASH = "flash"
+    PRO = "pro"
+
+    @property
+    def api_model(self) -> str:
+        return _MODEL_MAP[self.value]
+
+
+class ImageAspectRatio(str, Enum):
+    """Supported image aspect ratios for generation."""
+
+    RATIO_1_1 = "1:1"
+    RATIO_2_3 = "2:3"
+    RATIO_3_2 = "3:2"
+    RATIO_3_4 = "3:4"
+    RATIO_4_3 = "4:3"
+    RATIO_4_5 = "4:5"
+    RATIO_5_4 = "5:4"
+    RATIO_9_16 = "9:16"
+    RATIO_16_9 = "16:9"
+    RATIO_21_9 = "21:9"
@@ -0,0 +1,30 @@
+"""Helpers for running blocking calls concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Sequence
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def run_concurrently(calls: Sequence[Callable[[], T]], *, concurrency: int) -> list[T]:
+    """Run blocking callables in worker threads, at most `concurrency` at a time.
+
+    Results are returned in the order of `calls`. The first exception raised by
+    any call propagates to the caller.
+    """
+    if len(calls) <= 1 or concurrency <= 1:
+        return [call() for call in calls]
+    return asyncio.run(_gather_bounded(calls, concurrency=concurrency))
+
+
+async def _gather_bounded(calls: Sequence[Callable[[], T]], *, concurrency: int) -> list[T]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded(call: Callable[[], T]) -> T:
+        async with semaphore:
+            return await asyncio.to_thread(call)
+
+    return list(await asyncio.gather(*(_bounded(call) for call in calls)))
@@ -0,0 +1,16 @@
+"""Image format helpers."""
+
+from __future__ import annotations
+
+
+def sniff_image_mime_type(data: bytes) -> str | None:
+    """Return the MIME type of PNG, JPEG, WebP or GIF bytes from their magic number."""
+    if data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if data.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    if data.startswith((b"GIF87a", b"GIF89a")):
+        return "image/gif"
+    return None
@@ -0,0 +1,50 @@
+"""File I/O helpers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+import os
+from pathlib import Path
+
+
+def read_files_concurrently(paths: Sequence[Path]) -> list[bytes]:
+    """Read several files in parallel worker threads, preserving input order."""
+    if len(paths) <= 1:
+        return [path.read_bytes() for path in paths]
+    return asyncio.run(_read_all(paths))
+
+
+def find_missing_files(paths: Sequence[str]) -> list[str]:
+    """Return the entries of `paths` that are not existing regular files.
+
+    Paths sharing a parent directory are checked against one directory listing
+    instead of one stat() call each.
+    """
+    by_parent: dict[str, list[str]] = {}
+    for path in paths:
+        by_parent.setdefault(os.path.dirname(path) or os.curdir, []).append(path)
+
+    missing: list[str] = []
+    for parent, group in by_parent.items():
+        if len(group) == 1:
+            missing.extend(path for path in group if not os.path.isfile(path))
+            continue
+        try:
+            with os.scandir(parent) as entries:
+                files = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            missing.extend(path for path in group if not os.path.isfile(path))
+            continue
+        # Names absent from the listing are re-checked with stat() so that
+        # case-insensitive filesystems still accept differently-cased paths.
+        missing.extend(
+            path
+            for path in group
+            if os.path.basename(path) not in files and not os.path.isfile(path)
+        )
+    return missing
+
+
+async def _read_all(paths: Sequence[Path]) -> list[bytes]:
+    return list(await asyncio.gather(*(asyncio.to_thread(path.read_bytes) for path in paths)))
@@ -0,0 +1,29 @@
+"""JSON helpers that use orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional accelerator (`pip install nanoslides[fast]`).
+    orjson = None
+
+
+def dumps_pretty(payload: Any) -> bytes:
+    """Serialize a JSON-compatible payload as 2-space indented UTF-8 bytes.
+
+    Both backends write non-ASCII text as raw UTF-8, so the output bytes do not
+    depend on whether orjson is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON text or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
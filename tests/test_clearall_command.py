@@ -69,3 +69,17 @@ def test_clearall_command_does_not_delete_when_cancelled(
     clearall_commands.clearall_command()
 
     assert saved_states == []
+
+
+def test_slides_table_truncates_long_projects() -> None:
+    presentation = Presentation(
+        name="Long Deck",
+        created_at=datetime.now(timezone.utc),
+        engine="nanobanana",
+    )
+    for index in range(120):
+        presentation.add_slide(prompt=f"Slide {index}", image_path=None, metadata={})
+
+    table = clearall_commands._slides_table(presentation.ordered_slides, max_rows=50)
+
+    assert table.row_count == 51
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from nanoslides.utils.concurrency import run_concurrently
+
+
+def test_run_concurrently_preserves_order_and_bounds_parallelism() -> None:
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def _call(value: int) -> int:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return value
+
+    results = run_concurrently(
+        [lambda value=value: _call(value) for value in range(8)],
+        concurrency=3,
+    )
+
+    assert results == list(range(8))
+    assert 1 < peak <= 3
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from nanoslides.core.config import GlobalConfig, load_global_config, save_global_config
+
+
+def test_load_global_config_reflects_saves_and_returns_copies(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.toml"
+    assert load_global_config(config_path) == GlobalConfig()
+
+    save_global_config(GlobalConfig(api_keys={"GEMINI_API_KEY": "first"}), config_path)
+    loaded = load_global_config(config_path)
+    loaded.api_keys.clear()
+    assert load_global_config(config_path).api_keys == {"GEMINI_API_KEY": "first"}
+
+    save_global_config(GlobalConfig(api_keys={"GEMINI_API_KEY": "second"}), config_path)
+    assert load_global_config(config_path).api_keys == {"GEMINI_API_KEY": "second"}
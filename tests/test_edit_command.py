@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from nanoslides.cli.commands import edit as edit_commands
+from nanoslides.core.presentation import Presentation
+from nanoslides.core.project import save_project_state
+
+
+def _seed_project(tmp_path: Path) -> Presentation:
+    slides_dir = tmp_path / "slides"
+    slides_dir.mkdir()
+    presentation = Presentation(
+        name="Roadmap Deck",
+        created_at=datetime.now(timezone.utc),
+        engine="nanobanana",
+    )
+    for name, prompt in (("1_vision.png", "Company vision"), ("2_market.png", "Market")):
+        (slides_dir / name).write_bytes(b"fake-image-bytes")
+        presentation.add_slide(prompt=prompt, image_path=f"slides/{name}", metadata={})
+    save_project_state(presentation.to_project_state())
+    return presentation
+
+
+def test_resolve_edit_target_by_slide_id(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    seeded = _seed_project(tmp_path)
+    target_id = seeded.ordered_main_slides[1].id
+
+    source_path, presentation, slide = edit_commands._resolve_edit_target(target_id)
+
+    assert presentation is not None
+    assert slide is not None and slide.id == target_id
+    assert source_path == (tmp_path / "slides" / "2_market.png").resolve()
+
+
+def test_resolve_edit_target_by_image_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    seeded = _seed_project(tmp_path)
+
+    _, _, slide = edit_commands._resolve_edit_target("slides/1_vision.png")
+
+    assert slide is not None
+    assert slide.id == seeded.ordered_main_slides[0].id
+
+
+def test_resolve_edit_target_rejects_unknown_id(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    _seed_project(tmp_path)
+
+    with pytest.raises(ValueError, match="was not found"):
+        edit_commands._resolve_edit_target("missing-slide")
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from tenacity import wait_none
+
+from nanoslides.cli.commands import generate as generate_commands
+from nanoslides.core.interfaces import SlideResult
+from nanoslides.core.provider_errors import is_retryable_error
+from nanoslides.core.style import ResolvedStyle
+from nanoslides.engines.nanobanana import ImageAspectRatio, NanoBananaModel
+
+
+class _RateLimitError(Exception):
+    status_code = 429
+
+
+class _FlakyEngine:
+    def __init__(self, failures: list[Exception]) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    def generate(self, **kwargs: Any) -> SlideResult:
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return SlideResult(image_bytes=b"img", revised_prompt=kwargs["prompt"])
+
+
+def test_generate_with_retry_recovers_from_rate_limits(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(generate_commands, "_RETRY_WAIT", wait_none())
+    engine = _FlakyEngine([_RateLimitError("429 RESOURCE_EXHAUSTED")] * 2)
+
+    result = generate_commands._generate_with_retry(
+        engine,  # type: ignore[arg-type]
+        prompt="Roadmap",
+        style=ResolvedStyle(),
+        aspect_ratio=ImageAspectRatio.RATIO_16_9,
+    )
+
+    assert result.image_bytes == b"img"
+    assert engine.calls == 3
+
+
+def test_generate_with_retry_does_not_retry_client_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(generate_commands, "_RETRY_WAIT", wait_none())
+    engine = _FlakyEngine([ValueError("400 INVALID_ARGUMENT")])
+
+    with pytest.raises(ValueError):
+        generate_commands._generate_with_retry(
+            engine,  # type: ignore[arg-type]
+            prompt="Roadmap",
+            style=ResolvedStyle(),
+            aspect_ratio=ImageAspectRatio.RATIO_16_9,
+        )
+    assert engine.calls == 1
+
+
+def test_is_retryable_error_matches_quota_messages() -> None:
+    assert is_retryable_error(RuntimeError("Quota exceeded for requests"))
+    assert not is_retryable_error(RuntimeError("Invalid prompt"))
+
+
+def test_unique_paths_dedupes_equivalent_spellings(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "ref.png").write_bytes(b"png")
+
+    unique = generate_commands._unique_paths(
+        [Path("ref.png"), Path("./ref.png"), tmp_path / "sub" / ".." / "ref.png"]
+    )
+
+    assert unique == [tmp_path / "ref.png"]
+
+
+def test_resolve_cli_references_rejects_missing_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(ValueError, match="Reference image not found"):
+        generate_commands._resolve_cli_references(None, ["missing.png"])
+
+
+def test_rename_slide_file_skips_taken_names(tmp_path: Path) -> None:
+    for name in ("3_intro.png", "3_intro-2.png", "3_intro-3.png"):
+        (tmp_path / name).write_bytes(b"old")
+    generated = tmp_path / "slide-20260101.png"
+    generated.write_bytes(b"new")
+
+    renamed = generate_commands._rename_slide_file(generated, 3, "intro")
+
+    assert renamed == tmp_path / "3_intro-4.png"
+    assert renamed.read_bytes() == b"new"
+
+
+def test_unique_paths_ignores_case_on_case_insensitive_filesystems(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(generate_commands, "_FS_CASE_INSENSITIVE", True)
+
+    unique = generate_commands._unique_paths([tmp_path / "Image.PNG", tmp_path / "image.png"])
+
+    assert unique == [tmp_path / "Image.PNG"]
+
+
+def test_get_engine_reuses_instance_per_model_and_key() -> None:
+    generate_commands._get_engine.cache_clear()
+    first = generate_commands._get_engine(NanoBananaModel.FLASH, "key-a")
+    assert generate_commands._get_engine(NanoBananaModel.FLASH, "key-a") is first
+    assert generate_commands._get_engine(NanoBananaModel.PRO, "key-a") is not first
+    assert generate_commands._get_engine(NanoBananaModel.FLASH, "key-b") is not first
+    generate_commands._get_engine.cache_clear()
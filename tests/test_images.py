@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import pytest
+
+from nanoslides.utils.images import sniff_image_mime_type
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", "image/png"),
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF", "image/jpeg"),
+        (b"RIFF\x24\x00\x00\x00WEBPVP8 ", "image/webp"),
+        (b"GIF89a\x01\x00\x01\x00", "image/gif"),
+        (b"%PDF-1.7", None),
+        (b"", None),
+    ],
+)
+def test_sniff_image_mime_type(data: bytes, expected: str | None) -> None:
+    assert sniff_image_mime_type(data) == expected
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from nanoslides.utils.io import find_missing_files, read_files_concurrently
+
+
+def test_read_files_concurrently_preserves_order(tmp_path: Path) -> None:
+    paths = []
+    for index in range(4):
+        path = tmp_path / f"ref-{index}.png"
+        path.write_bytes(f"image-{index}".encode())
+        paths.append(path)
+
+    assert read_files_concurrently(paths) == [f"image-{index}".encode() for index in range(4)]
+
+
+def test_find_missing_files_checks_shared_directories(tmp_path: Path) -> None:
+    for name in ("a.png", "b.png"):
+        (tmp_path / name).write_bytes(b"png")
+    (tmp_path / "folder.png").mkdir()
+    paths = [str(tmp_path / name) for name in ("a.png", "b.png", "c.png", "folder.png")]
+
+    assert find_missing_files(paths) == [str(tmp_path / "c.png"), str(tmp_path / "folder.png")]
+    assert find_missing_files([str(tmp_path / "a.png")]) == []
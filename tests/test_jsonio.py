@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import pytest
+
+from nanoslides.utils import jsonio
+
+
+@pytest.mark.parametrize("backend", ["orjson", "json"])
+def test_dumps_pretty_round_trips_non_ascii(
+    backend: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    payload = {"prompt": "Café résumé 🍌", "slides": [{"order": 1, "tags": []}]}
+
+    data = jsonio.dumps_pretty(payload)
+
+    assert data == (
+        '{\n  "prompt": "Café résumé 🍌",\n  "slides": [\n'
+        '    {\n      "order": 1,\n      "tags": []\n    }\n  ]\n}\n'
+    ).encode("utf-8")
+    assert jsonio.loads(data) == payload
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from google.genai import types
+from PIL import Image
+import pytest
+
+from nanoslides.core.style import ResolvedStyle
+from nanoslides.engines import nanobanana as nanobanana_module
+from nanoslides.engines.nanobanana import NanoBananaModel, NanoBananaSlideEngine
+
+
+class _FakeBatches:
+    def __init__(
+        self,
+        *,
+        state: types.JobState = types.JobState.JOB_STATE_SUCCEEDED,
+        failed_indexes: tuple[int, ...] = (),
+    ) -> None:
+        self.created: dict[str, Any] = {}
+        self.polls = 0
+        self.cancelled: list[str] = []
+        self._state = state
+        self._failed_indexes = failed_indexes
+
+    def create(self, *, model: str, src: list[types.InlinedRequest], config: Any) -> Any:
+        self.created = {"model": model, "src": src}
+        return SimpleNamespace(name="batches/123", state=types.JobState.JOB_STATE_PENDING)
+
+    def get(self, *, name: str) -> Any:
+        self.polls += 1
+        responses = [
+            types.InlinedResponse(error=types.JobError(message="quota exceeded"))
+            if index in self._failed_indexes
+            else types.InlinedResponse(
+                response=types.GenerateContentResponse(
+                    candidates=[
+                        types.Candidate(
+                            content=types.Content(
+                                parts=[
+                                    types.Part.from_bytes(
+                                        data=b"img-%d" % index, mime_type="image/png"
+                                    )
+                                ]
+                            )
+                        )
+                    ]
+                )
+            )
+            for index in range(len(self.created["src"]))
+        ]
+        return SimpleNamespace(
+            name=name,
+            state=self._state,
+            dest=SimpleNamespace(inlined_responses=responses),
+        )
+
+    def cancel(self, *, name: str) -> None:
+        self.cancelled.append(name)
+
+
+def test_generate_batch_submits_one_job_and_maps_responses() -> None:
+    engine = NanoBananaSlideEngine(model=NanoBananaModel.FLASH, api_key="test-key")
+    batches = _FakeBatches()
+    engine._client = SimpleNamespace(batches=batches)
+
+    results = engine.generate_batch(["Quarterly roadmap"] * 3, poll_interval=0)
+
+    assert batches.created["model"] == NanoBananaModel.FLASH.api_model
+    assert len(batches.created["src"]) == 3
+    assert batches.polls == 1
+    assert [result.image_bytes for result in results] == [b"img-0", b"img-1", b"img-2"]
+    assert all(result.metadata["batch_job"] == "batches/123" for result in results)
+
+
+def test_generate_batch_keeps_successes_from_partially_succeeded_job() -> None:
+    engine = NanoBananaSlideEngine(model=NanoBananaModel.FLASH, api_key="test-key")
+    engine._client = SimpleNamespace(
+        batches=_FakeBatches(
+            state=types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED, failed_indexes=(1,)
+        )
+    )
+
+    first, second, third = engine.generate_batch(["Quarterly roadmap"] * 3, poll_interval=0)
+
+    assert first.image_bytes == b"img-0"
+    assert isinstance(second, RuntimeError)
+    assert "quota exceeded" in str(second)
+    assert third.image_bytes == b"img-2"
+
+
+class _StuckBatches(_FakeBatches):
+    def get(self, *, name: str) -> Any:
+        self.polls += 1
+        return SimpleNamespace(name=name, state=types.JobState.JOB_STATE_RUNNING)
+
+
+def test_generate_batch_cancels_job_on_timeout() -> None:
+    engine = NanoBananaSlideEngine(model=NanoBananaModel.FLASH, api_key="test-key")
+    batches = _StuckBatches()
+    engine._client = SimpleNamespace(batches=batches)
+
+    with pytest.raises(TimeoutError):
+        engine.generate_batch(["Quarterly roadmap"], poll_interval=0.01, timeout=0.05)
+
+    assert batches.cancelled == ["batches/123"]
+
+
+def test_generate_batch_cancels_job_on_interrupt(monkeypatch: pytest.MonkeyPatch) -> None:
+    engine = NanoBananaSlideEngine(model=NanoBananaModel.FLASH, api_key="test-key")
+    batches = _FakeBatches()
+    engine._client = SimpleNamespace(batches=batches)
+
+    def _interrupt(_: float) -> None:
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(nanobanana_module.time, "sleep", _interrupt)
+
+    with pytest.raises(KeyboardInterrupt):
+        engine.generate_batch(["Quarterly roadmap"])
+
+    assert batches.cancelled == ["batches/123"]
+
+
+def test_prepare_reference_images_downscales_large_images(tmp_path: Path) -> None:
+    large_path = tmp_path / "large.png"
+    small_path = tmp_path / "small.png"
+    Image.new("RGB", (2048, 1024), "navy").save(large_path)
+    Image.new("RGB", (64, 64), "white").save(small_path)
+    engine = NanoBananaSlideEngine(model=NanoBananaModel.FLASH, api_key="test-key")
+
+    large, small = engine.prepare_reference_images(
+        ResolvedStyle(reference_images=[str(large_path), str(small_path)])
+    )
+
+    with Image.open(io.BytesIO(large)) as image:
+        assert image.size == (1024, 512)
+    assert small == small_path.read_bytes()
+
+
+def test_engines_share_a_client_per_api_key() -> None:
+    flash = NanoBananaSlideEngine(model=NanoBananaModel.FLASH, api_key="shared-key")
+    pro = NanoBananaSlideEngine(model=NanoBananaModel.PRO, api_key="shared-key")
+    other = NanoBananaSlideEngine(model=NanoBananaModel.FLASH, api_key="other-key")
+
+    assert flash._client is pro._client
+    assert other._client is not flash._client
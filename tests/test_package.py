@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import nanoslides
+
+
+def test_import_does_not_load_engine_sdk() -> None:
+    code = "import sys, nanoslides; print('google.genai' in sys.modules)"
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    assert output == "False"
+
+
+def test_lazy_exports_resolve_on_access() -> None:
+    from nanoslides.core.project import SlideEntry
+
+    assert nanoslides.SlideEntry is SlideEntry
+    assert set(nanoslides.__all__) <= set(dir(nanoslides))
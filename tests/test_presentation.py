@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from nanoslides.cli.commands import generate as generate_commands
+import nanoslides.core.presentation as presentation_module
+from nanoslides.core.presentation import Presentation, ProjectStateWriter
+
+
+def _empty_presentation() -> Presentation:
+    return Presentation(
+        name="Roadmap Deck",
+        created_at=datetime.now(timezone.utc),
+        engine="nanobanana",
+    )
+
+
+def test_project_state_writer_coalesces_writes(monkeypatch: pytest.MonkeyPatch) -> None:
+    saved_states: list[object] = []
+    monkeypatch.setattr(
+        presentation_module,
+        "save_project_state",
+        lambda state, path: saved_states.append(state),
+    )
+    presentation = _empty_presentation()
+
+    with ProjectStateWriter(presentation) as writer:
+        for prompt in ("Vision", "Market", "Plan"):
+            presentation.add_slide(prompt=prompt, image_path=None, metadata={})
+            writer.mark_dirty()
+
+    assert len(saved_states) == 1
+    assert len(getattr(saved_states[0], "slides")) == 3
+
+
+def test_project_state_writer_skips_clean_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    saved_states: list[object] = []
+    monkeypatch.setattr(
+        presentation_module,
+        "save_project_state",
+        lambda state, path: saved_states.append(state),
+    )
+
+    with ProjectStateWriter(_empty_presentation()):
+        pass
+
+    assert saved_states == []
+
+
+def test_append_slides_in_batch_saves_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    saved: list[object] = []
+    monkeypatch.setattr(
+        presentation_module, "save_project_state", lambda state, path: saved.append(state)
+    )
+    presentation = _empty_presentation()
+
+    with presentation.batch() as state_writer:
+        for prompt in ("Intro", "Roadmap", "Team"):
+            generate_commands._append_slide_to_project(
+                prompt, None, {}, state_writer=state_writer
+            )
+
+    assert len(saved) == 1
+    assert [slide.order for slide in presentation.slides] == [1, 2, 3]
+
+
+def test_move_slide_to_current_position_keeps_order() -> None:
+    presentation = _empty_presentation()
+    for prompt in ("Vision", "Market", "Plan"):
+        presentation.add_slide(prompt=prompt, image_path=None, metadata={})
+    for slide, order in zip(presentation.slides, (10, 20, 30)):
+        slide.order = order
+    moving_id = presentation.slides[1].id
+
+    assert presentation.move_slide(moving_id, 2) == (2, 2)
+    assert [slide.order for slide in presentation.slides] == [10, 20, 30]
+
+    with pytest.raises(ValueError):
+        presentation.move_slide("missing", 1)
+
+
+def test_remove_slide_compacts_remaining_order() -> None:
+    presentation = _empty_presentation()
+    for prompt in ("Vision", "Market", "Plan"):
+        presentation.add_slide(prompt=prompt, image_path=None, metadata={})
+    removed_id = presentation.slides[0].id
+
+    removed = presentation.remove_slide(removed_id)
+
+    assert removed is not None and removed.id == removed_id
+    assert [(slide.prompt, slide.order) for slide in presentation.slides] == [
+        ("Market", 1),
+        ("Plan", 2),
+    ]
+    assert presentation.remove_slide("missing") is None
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from nanoslides.cli.commands import presentation as presentation_commands
+from nanoslides.core.interfaces import SlideResult
+from nanoslides.core.style import ResolvedStyle
+from nanoslides.engines import nanobanana as nanobanana_module
+from nanoslides.engines.nanobanana import ImageAspectRatio, NanoBananaModel
+
+
+class _SlowEngine:
+    active = 0
+    peak = 0
+    _lock = threading.Lock()
+
+    def __init__(self, **_: Any) -> None:
+        pass
+
+    def prepare_reference_images(self, style: ResolvedStyle | None) -> list[bytes]:
+        return []
+
+    def generate(self, prompt: str, **_: Any) -> SlideResult:
+        with self._lock:
+            type(self).active += 1
+            type(self).peak = max(type(self).peak, type(self).active)
+        time.sleep(0.02)
+        with self._lock:
+            type(self).active -= 1
+        return SlideResult(image_bytes=b"png", revised_prompt=prompt)
+
+
+def test_generate_planned_slides_runs_in_parallel_and_keeps_plan_order(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(nanobanana_module, "NanoBananaSlideEngine", _SlowEngine)
+    plan = presentation_commands.PresentationPlan(
+        deck_title="Roadmap",
+        slides=[
+            presentation_commands.PlannedSlide(title=f"Slide {index}", prompt=f"prompt {index}")
+            for index in range(1, 7)
+        ],
+    )
+
+    rows = presentation_commands._generate_planned_slides(
+        plan=plan,
+        style=ResolvedStyle(),
+        model=NanoBananaModel.FLASH,
+        api_key="test-key",
+        aspect_ratio=ImageAspectRatio.RATIO_16_9,
+        output_dir=tmp_path / "slides",
+        reference_files=[],
+        concurrency=3,
+    )
+
+    assert [row["title"] for row in rows] == [f"Slide {index}" for index in range(1, 7)]
+    assert 1 < _SlowEngine.peak <= 3
+
+
+class _RejectedBatchError(Exception):
+    status_code = 400
+
+
+class _BatchRejectingEngine(_SlowEngine):
+    def generate_batch(self, prompts: list[str], **_: Any) -> list[SlideResult]:
+        raise _RejectedBatchError("400 INVALID_ARGUMENT")
+
+
+def test_generate_planned_slides_falls_back_when_batch_is_rejected(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(nanobanana_module, "NanoBananaSlideEngine", _BatchRejectingEngine)
+    plan = presentation_commands.PresentationPlan(
+        deck_title="Roadmap",
+        slides=[presentation_commands.PlannedSlide(title="Intro", prompt="intro")],
+    )
+
+    rows = presentation_commands._generate_planned_slides(
+        plan=plan,
+        style=ResolvedStyle(),
+        model=NanoBananaModel.FLASH,
+        api_key="test-key",
+        aspect_ratio=ImageAspectRatio.RATIO_16_9,
+        output_dir=tmp_path / "slides",
+        reference_files=[],
+        use_batch=True,
+    )
+
+    assert [row["title"] for row in rows] == ["Intro"]
+
+
+class _PartialBatchEngine(_SlowEngine):
+    generated: list[str] = []
+
+    def generate_batch(self, prompts: list[str], **_: Any) -> list[SlideResult | RuntimeError]:
+        return [
+            RuntimeError("batch request failed")
+            if prompt == "roadmap"
+            else SlideResult(image_bytes=b"batch", revised_prompt=prompt)
+            for prompt in prompts
+        ]
+
+    def generate(self, prompt: str, **kwargs: Any) -> SlideResult:
+        type(self).generated.append(prompt)
+        return super().generate(prompt, **kwargs)
+
+
+def test_generate_planned_slides_regenerates_only_failed_batch_slides(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(nanobanana_module, "NanoBananaSlideEngine", _PartialBatchEngine)
+    plan = presentation_commands.PresentationPlan(
+        deck_title="Roadmap",
+        slides=[
+            presentation_commands.PlannedSlide(title=title, prompt=title.lower())
+            for title in ("Intro", "Roadmap", "Team")
+        ],
+    )
+
+    rows = presentation_commands._generate_planned_slides(
+        plan=plan,
+        style=ResolvedStyle(),
+        model=NanoBananaModel.FLASH,
+        api_key="test-key",
+        aspect_ratio=ImageAspectRatio.RATIO_16_9,
+        output_dir=tmp_path / "slides",
+        reference_files=[],
+        use_batch=True,
+    )
+
+    assert _PartialBatchEngine.generated == ["roadmap"]
+    assert [row["title"] for row in rows] == ["Intro", "Roadmap", "Team"]
+    assert [Path(str(row["path"])).read_bytes() for row in rows] == [b"batch", b"png", b"batch"]
+
+
+def test_planner_reference_parts_keep_input_order(tmp_path: Path) -> None:
+    first = tmp_path / "first.png"
+    second = tmp_path / "second.jpg"
+    first.write_bytes(b"first")
+    second.write_bytes(b"second")
+
+    parts = presentation_commands._planner_reference_parts([str(first), str(second)])
+
+    assert [part.inline_data.data for part in parts] == [b"first", b"second"]
+    assert [part.inline_data.mime_type for part in parts] == ["image/png", "image/jpeg"]
+
+
+@pytest.mark.parametrize(
+    "raw_text",
+    [
+        '{"deck_title": "Roadmap"}',
+        '```json\n{"deck_title": "Roadmap"}\n```',
+        '```\n{"deck_title": "Roadmap"}\n```',
+    ],
+)
+def test_parse_json_response_strips_code_fences(raw_text: str) -> None:
+    response = SimpleNamespace(text=raw_text)
+
+    assert presentation_commands._parse_json_response(response) == {"deck_title": "Roadmap"}
+
+
+def test_parse_json_response_rejects_invalid_json() -> None:
+    with pytest.raises(RuntimeError, match="invalid JSON"):
+        presentation_commands._parse_json_response(SimpleNamespace(text="```json\n{oops\n```"))
+
+
+def _deck_request(prompt: str) -> presentation_commands.PresentationRequest:
+    return presentation_commands.PresentationRequest(
+        prompt=prompt,
+        detail_mode="presenter",
+        language="en",
+        length="default",
+        style_id=None,
+        references=[],
+        reference_files=[],
+    )
+
+
+def test_local_plan_uses_numbered_slides_and_header_as_title() -> None:
+    plan = presentation_commands._plan_presentation_locally(
+        _deck_request("Q3 roadmap\n1. Vision and goals\n2) Market size\n- Next steps")
+    )
+
+    assert plan.deck_title == "Q3 roadmap"
+    assert [slide.prompt for slide in plan.slides] == [
+        "Vision and goals",
+        "Market size",
+        "Next steps",
+    ]
+
+
+def test_local_plan_splits_sections() -> None:
+    plan = presentation_commands._plan_presentation_locally(
+        _deck_request("Title slide\nwith subtitle\n---\nAgenda\n---\nThanks")
+    )
+
+    assert [slide.title for slide in plan.slides] == ["Title slide", "Agenda", "Thanks"]
+    assert plan.slides[0].prompt == "Title slide\nwith subtitle"
+
+
+def test_local_plan_requires_explicit_slides() -> None:
+    with pytest.raises(ValueError, match="--no-planner"):
+        presentation_commands._plan_presentation_locally(_deck_request("A deck about cats"))
+
+
+def test_parse_json_response_falls_back_to_candidate_parts() -> None:
+    response = SimpleNamespace(
+        text=None,
+        candidates=[
+            SimpleNamespace(content=None),
+            SimpleNamespace(
+                content=SimpleNamespace(
+                    parts=[SimpleNamespace(text=None), SimpleNamespace(text='{"a": 1}')]
+                )
+            ),
+        ],
+    )
+
+    assert presentation_commands._parse_json_response(response) == {"a": 1}
+
+
+def test_rename_slide_file_skips_taken_names(tmp_path: Path) -> None:
+    (tmp_path / "3_abc.png").write_bytes(b"old")
+    (tmp_path / "3_abc-2.png").write_bytes(b"old")
+    generated = tmp_path / "slide-03-raw.png"
+    generated.write_bytes(b"new")
+    existing_names = {path.name for path in tmp_path.iterdir()}
+
+    renamed = presentation_commands._rename_slide_file(generated, 3, "abc", existing_names)
+
+    assert renamed == tmp_path / "3_abc-3.png"
+    assert renamed.read_bytes() == b"new"
+    assert "3_abc-3.png" in existing_names
+    assert "slide-03-raw.png" not in existing_names
+
+
+def test_generate_command_preview_escapes_prompt_and_appends_options() -> None:
+    options = presentation_commands._generate_command_options(
+        style=ResolvedStyle(style_id="corporate"),
+        aspect_ratio=ImageAspectRatio.RATIO_16_9,
+    )
+
+    preview = presentation_commands._generate_command_preview(
+        prompt='Say "hi"', options=options
+    )
+
+    assert preview == 'nanoslides generate "Say \\"hi\\"" --aspect-ratio 16:9 --style-id corporate'
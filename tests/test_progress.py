@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from io import StringIO
+
+from rich.console import Console
+
+from nanoslides.cli.progress import step_progress
+
+
+def test_step_progress_prints_message_once_off_terminal() -> None:
+    output = StringIO()
+    console = Console(file=output, force_terminal=False)
+
+    with step_progress(console, "Generating 3 slides", total=3) as advance:
+        for _ in range(3):
+            advance()
+
+    assert output.getvalue() == "Generating 3 slides\n"
+
+
+def test_step_progress_counts_steps_on_terminal() -> None:
+    output = StringIO()
+    console = Console(file=output, force_terminal=True, width=80)
+
+    with step_progress(console, "Generating 2 slides", total=2) as advance:
+        advance()
+        advance()
+
+    assert "2/2" in output.getvalue()
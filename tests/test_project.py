@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import os
+from pathlib import Path
+import stat
+
+import pytest
+
+from nanoslides.core.project import ProjectState, SlideEntry, load_project_state, save_project_state
+from nanoslides.utils import jsonio
+
+
+def test_load_project_state_returns_independent_copies(tmp_path: Path) -> None:
+    state_path = tmp_path / "slides.json"
+    save_project_state(
+        ProjectState(
+            name="Deck",
+            created_at=datetime.now(timezone.utc),
+            engine="nanobanana",
+            slides=[SlideEntry(id="intro", prompt="Intro")],
+        ),
+        state_path,
+    )
+
+    first = load_project_state(state_path)
+    first.slides.clear()
+
+    assert [slide.id for slide in load_project_state(state_path).slides] == ["intro"]
+
+
+def test_load_project_state_sees_saved_changes(tmp_path: Path) -> None:
+    state_path = tmp_path / "slides.json"
+    state = ProjectState(name="Deck", created_at=datetime.now(timezone.utc), engine="nanobanana")
+    save_project_state(state, state_path)
+    assert load_project_state(state_path).slides == []
+
+    state.slides.append(SlideEntry(id="intro", prompt="Intro"))
+    save_project_state(state, state_path)
+
+    assert [slide.id for slide in load_project_state(state_path).slides] == ["intro"]
+
+
+def test_save_project_state_leaves_no_temporary_file(tmp_path: Path) -> None:
+    state_path = tmp_path / "slides.json"
+    state = ProjectState(name="Deck", created_at=datetime.now(timezone.utc), engine="nanobanana")
+
+    save_project_state(state, state_path)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["slides.json"]
+
+
+def test_save_project_state_keeps_file_permissions(tmp_path: Path) -> None:
+    state_path = tmp_path / "slides.json"
+    state = ProjectState(name="Deck", created_at=datetime.now(timezone.utc), engine="nanobanana")
+    save_project_state(state, state_path)
+    state_path.chmod(0o640)
+
+    state.slides.append(SlideEntry(id="intro", prompt="Intro"))
+    save_project_state(state, state_path)
+
+    assert stat.S_IMODE(state_path.stat().st_mode) == 0o640
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["slides.json"]
+
+
+def test_load_project_state_orders_slides(tmp_path: Path) -> None:
+    state_path = tmp_path / "slides.json"
+    save_project_state(
+        ProjectState(
+            name="Deck",
+            created_at=datetime.now(timezone.utc),
+            engine="nanobanana",
+            slides=[
+                SlideEntry(id="team", order=3),
+                SlideEntry(id="intro", order=1),
+                SlideEntry(id="roadmap", order=2),
+            ],
+        ),
+        state_path,
+    )
+
+    assert [slide.id for slide in load_project_state(state_path).slides] == [
+        "intro",
+        "roadmap",
+        "team",
+    ]
+
+
+def test_save_project_state_skips_unchanged_writes(tmp_path: Path) -> None:
+    state_path = tmp_path / "slides.json"
+    state = ProjectState(name="Deck", created_at=datetime.now(timezone.utc), engine="nanobanana")
+    save_project_state(state, state_path)
+    first_mtime = state_path.stat().st_mtime_ns
+
+    os.utime(state_path, ns=(first_mtime - 10**9, first_mtime - 10**9))
+    save_project_state(state, state_path)
+
+    assert state_path.stat().st_mtime_ns == first_mtime - 10**9
+
+
+def test_save_project_state_skips_rewrite_across_json_backends(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("orjson")
+    state_path = tmp_path / "slides.json"
+    state = ProjectState(
+        name="Café deck",
+        created_at=datetime.now(timezone.utc),
+        engine="nanobanana",
+        slides=[SlideEntry(id="intro", prompt="Résumé of the año")],
+    )
+    save_project_state(state, state_path)
+    first_mtime = state_path.stat().st_mtime_ns
+
+    os.utime(state_path, ns=(first_mtime - 10**9, first_mtime - 10**9))
+    monkeypatch.setattr(jsonio, "orjson", None)
+    save_project_state(state, state_path)
+
+    assert state_path.stat().st_mtime_ns == first_mtime - 10**9
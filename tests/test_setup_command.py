@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import pytest
+
+from nanoslides.cli.commands import setup as setup_commands
+from nanoslides.core.config import GEMINI_API_KEY_NAME, OPENAI_API_KEY_NAME
+
+
+def test_select_provider_key_follows_arrow_keys(monkeypatch: pytest.MonkeyPatch) -> None:
+    keys = iter(["\x1b[B", "x", "\x1b[B", "\x1b[B", "\r"])
+    monkeypatch.setattr(setup_commands.click, "getchar", lambda: next(keys))
+
+    selected = setup_commands._select_provider_key(configured_provider_keys=set())
+
+    assert selected == GEMINI_API_KEY_NAME
+
+
+def test_provider_menu_marks_configured_providers() -> None:
+    menu = setup_commands._provider_menu(
+        selected_index=0,
+        configured_provider_keys={OPENAI_API_KEY_NAME},
+    )
+
+    assert menu.plain.splitlines()[1:] == ["❯ OpenAI [configured]", "  Google Gemini"]
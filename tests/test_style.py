@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from nanoslides.core.style import (
+    GlobalStylesConfig,
+    StyleDefinition,
+    load_global_styles,
+    save_global_styles,
+)
+
+
+def test_load_global_styles_reflects_saves_and_returns_copies(tmp_path: Path) -> None:
+    styles_path = tmp_path / "styles.json"
+    save_global_styles(
+        GlobalStylesConfig(styles={"corporate": StyleDefinition(base_prompt="Navy")}),
+        styles_path,
+    )
+
+    loaded = load_global_styles(styles_path)
+    loaded.styles.clear()
+    assert list(load_global_styles(styles_path).styles) == ["corporate"]
+
+    save_global_styles(
+        GlobalStylesConfig(styles={"playful": StyleDefinition(base_prompt="Bright")}),
+        styles_path,
+    )
+    assert list(load_global_styles(styles_path).styles) == ["playful"]
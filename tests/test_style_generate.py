@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -265,3 +266,36 @@ def test_style_generate_command_can_save_globally(
 
     assert "styles" in saved
     assert "brand-global" in registry.styles
+
+
+def test_parse_slides_base_reference_input_dedupes_and_validates(tmp_path: Path) -> None:
+    first = tmp_path / "first.png"
+    second = tmp_path / "second.png"
+    first.write_bytes(b"first")
+    second.write_bytes(b"second")
+
+    parsed = style_commands._parse_slides_base_reference_input(
+        f"{first}, {second},{first}, "
+    )
+
+    assert parsed == [str(first.resolve()), str(second.resolve())]
+    with pytest.raises(ValueError, match="missing.png"):
+        style_commands._parse_slides_base_reference_input(f"{first}, {tmp_path / 'missing.png'}")
+
+
+def test_resolve_reference_paths_resolves_shared_parent(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    images = tmp_path / "images"
+    images.mkdir()
+    (tmp_path / "link").symlink_to(images)
+    monkeypatch.chdir(tmp_path)
+
+    resolved = style_commands._resolve_reference_paths(["link/a.png", Path("link/b.png"), "c.png"])
+
+    real_root = os.path.realpath(tmp_path)
+    assert resolved == [
+        os.path.join(real_root, "images", "a.png"),
+        os.path.join(real_root, "images", "b.png"),
+        os.path.join(real_root, "c.png"),
+    ]